@@ -1,4 +1,5 @@
 import sys
+import multiprocessing
 from PySide6.QtCore import Qt, QPoint, QSize, QByteArray, QRectF
 from PySide6.QtGui import QPixmap, QIcon, QPainter, QColor
 from PySide6.QtSvg import QSvgRenderer
@@ -357,6 +358,9 @@ class MainWindow(RoundedWindow):
 
 
 if __name__ == '__main__':
+    # Required for the optimizers' worker processes in frozen (.exe) builds
+    multiprocessing.freeze_support()
+
     # 1. Check if a QApplication instance already exists
     app = QApplication.instance()
     if app is None:
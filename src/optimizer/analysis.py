@@ -1,25 +1,45 @@
 # analysis.py
 
-import pandas as pd
 import numpy as np
 
-def calculate_buckling_indices(stresses_df):
-    """Calculates buckling-related metrics from simulation results."""
-    compressive_members = stresses_df[stresses_df['axial_force'] < 0].copy()
-    
-    if compressive_members.empty or compressive_members['Pc'].isnull().all():
-        return {'buckling_distribution_factor': 0.0, 'coefficient_of_variation': 0.0}
+# Order of the objective terms when the weights are given as an array (see weight_vector)
+WEIGHT_KEYS = ('buckling_distribution_factor', 'buckling_penalty', 'material_usage',
+               'compressive_uniformity', 'average_force_magnitude')
+
+def weight_vector(weights):
+    """Returns the weights as a float array in WEIGHT_KEYS order; arrays are passed through unchanged."""
+    if isinstance(weights, np.ndarray):
+        return weights
+    return np.array([weights[key] for key in WEIGHT_KEYS], dtype=float)
+
+def _compressive_utilization(results):
+    """|force| and utilization mu = |force / Pc| of the compressive members that have a Pc."""
+    axial_force = np.asarray(results['axial_force'], dtype=float)
+    pc = np.asarray(results['Pc'], dtype=float)
+    compressive = (axial_force < 0) & ~np.isnan(pc)
+    force = np.abs(axial_force[compressive])
+    return force, np.abs(force / pc[compressive])
 
-    compressive_members.dropna(subset=['Pc'], inplace=True)
-    compressive_members['mu'] = np.abs(compressive_members['axial_force'] / compressive_members['Pc'])
+def calculate_buckling_indices(stresses_df, compressive=None):
+    """
+    Calculates buckling-related metrics from simulation results.
+    Accepts the results DataFrame or fem_solver.AnalysisArrays; compressive is an optional
+    precomputed _compressive_utilization(stresses_df).
+    """
+    # Plain arrays: this runs on every objective evaluation, where pandas masking/copies dominate
+    force, mu = compressive if compressive is not None else _compressive_utilization(stresses_df)
     
-    numerator = (compressive_members['mu'] * np.abs(compressive_members['axial_force'])).sum()
-    denominator = np.abs(compressive_members['axial_force']).sum()
-    gamma = numerator / denominator if denominator != 0 else 0
+    if force.size == 0:
+        return {'buckling_distribution_factor': 0.0, 'coefficient_of_variation': 0.0}
     
-    weights = np.abs(compressive_members['axial_force'])
-    variance = np.average((compressive_members['mu'] - gamma)**2, weights=weights)
-    s_mu = np.sqrt(variance)
+    # Force-weighted mean and standard deviation of the utilization, from the weighted sums of
+    # mu and mu^2 (variance = E[mu^2] - gamma^2, clamped at 0 against rounding), so no pass
+    # depends on gamma; mu may be shared with the penalty check, so it is not modified
+    denominator = force.sum()
+    weighted_mu = mu * force
+    gamma = weighted_mu.sum() / denominator if denominator != 0 else 0
+    variance = weighted_mu @ mu / denominator - gamma * gamma
+    s_mu = np.sqrt(max(variance, 0.0))
 
     buckling_distribution_factor = gamma + 2 * s_mu
     v_mu = s_mu / gamma if gamma != 0 else float('inf')
@@ -29,31 +49,38 @@ def calculate_buckling_indices(stresses_df):
         'coefficient_of_variation': v_mu
     }
 
-def calculate_buckling_penalty(stresses_df):
+def calculate_buckling_penalty(stresses_df, compressive=None):
     """Calculates a penalty if any member's buckling utilization exceeds 1."""
     if stresses_df.empty:
         return 1e6 # High penalty if solver fails
     
-    compressive_members = stresses_df[stresses_df['axial_force'] < 0].copy()
-    if not compressive_members.empty:
-        compressive_members.dropna(subset=['Pc'], inplace=True)
-        mu = np.abs(compressive_members['axial_force'] / compressive_members['Pc'])
-        if np.any(mu >= 1):
-            return 100.0
+    if compressive is not None:
+        _, mu = compressive
+        overloaded = np.any(mu >= 1)
+    else:
+        # |force / Pc| >= 1 tested as |force| >= |Pc|, without building mu; NaN Pc compares False
+        axial_force = np.asarray(stresses_df['axial_force'], dtype=float)
+        pc = np.asarray(stresses_df['Pc'], dtype=float)
+        overloaded = np.any((axial_force < 0) & (np.abs(axial_force) >= np.abs(pc)))
+    if overloaded:
+        return 100.0
     return 0.0
 
 def normalized_material_usage(stresses_df, initial_lengths):
     """Calculates normalized material usage."""
-    if stresses_df.empty or 'A' not in stresses_df.columns or 'L' not in stresses_df.columns:
+    if stresses_df.empty:
         return 1e6
     
-    current_usage = (stresses_df['A'] * stresses_df['L']).sum()
-    initial_usage = (stresses_df['A'] * initial_lengths).sum()
+    A = np.asarray(stresses_df['A'], dtype=float)
+    L = np.asarray(stresses_df['L'], dtype=float)
+    # Results are numbered from 0, so they line up with the first len(A) initial lengths
+    current_usage = A @ L
+    initial_usage = A @ np.asarray(initial_lengths, dtype=float)[:len(A)]
     return current_usage / initial_usage if initial_usage > 0 else 0
 
 def normalized_average_force(stresses_df, initial_forces):
     """Calculates the normalized average magnitude of internal forces."""
-    if stresses_df.empty or initial_forces.empty:
+    if stresses_df.empty or len(initial_forces) == 0:
         return 1e6
     
     avg_force = np.mean(np.abs(stresses_df['axial_force']))
@@ -63,28 +90,29 @@ def normalized_average_force(stresses_df, initial_forces):
 def get_objective(model, weights):
     """
     Combines all metrics from a TrussModel into a single objective score.
+    weights is a dict or a weight_vector array.
     """
     if not model.is_analyzed:
         model.run_analysis()
     
-    stresses_df = model.stresses_df
+    # Every metric reads the same few columns, extracted once per analysis
+    results = model.result_arrays()
+    # The buckling metrics share one compressive mask and utilization array
+    compressive = _compressive_utilization(results)
     
     # Calculate all individual metric scores
-    buckling_metrics = calculate_buckling_indices(stresses_df)
-    buckling_penalty = calculate_buckling_penalty(stresses_df)
-    material_usage = normalized_material_usage(stresses_df, model.initial_lengths)
-    avg_force = normalized_average_force(stresses_df, model.initial_forces)
+    buckling_metrics = calculate_buckling_indices(results, compressive)
+    buckling_penalty = calculate_buckling_penalty(results, compressive)
+    material_usage = normalized_material_usage(results, model.initial_length_values)
+    avg_force = normalized_average_force(results, model.initial_force_values)
     
-    # Combine scores using weights
-    unnormalized_score = (
-        buckling_metrics['buckling_distribution_factor'] * weights['buckling_distribution_factor'] +
-        buckling_penalty * weights['buckling_penalty'] +
-        material_usage * weights['material_usage'] +
-        buckling_metrics['coefficient_of_variation'] * weights['compressive_uniformity'] +
-        avg_force * weights['average_force_magnitude']
-    )
+    # Combine scores using weights (terms in WEIGHT_KEYS order)
+    weights = weight_vector(weights)
+    terms = np.array([buckling_metrics['buckling_distribution_factor'], buckling_penalty, material_usage,
+                      buckling_metrics['coefficient_of_variation'], avg_force])
+    unnormalized_score = terms @ weights
 
-    total_weight = sum(weights.values())
+    total_weight = weights.sum()
     score = unnormalized_score / total_weight if total_weight > 0 else float('inf')
     
     # Bundle metrics for display
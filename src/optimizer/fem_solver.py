@@ -2,70 +2,151 @@
 
 import numpy as np
 import pandas as pd
-from math import sqrt, pi
-from scipy.sparse import lil_matrix
-from scipy.sparse.linalg import spsolve
+from dataclasses import dataclass, fields
+from math import pi
+from scipy.sparse import coo_matrix, diags
+from scipy.sparse.linalg import spsolve, splu, cg
+from scipy.sparse.csgraph import reverse_cuthill_mckee
 
-def assemble_truss_stiffness(points_df, trusses_df, materials_df):
-    """Build global stiffness and element auxiliary data."""
-    node_ids = list(points_df['Node'])
-    nnode = len(node_ids)
-    id_to_idx = {nid: i for i, nid in enumerate(node_ids)}
-    ndof = 2 * nnode
+# With solve_mode='auto', reduced systems with at least this many DOF are solved iteratively
+# (Jacobi-preconditioned conjugate gradients) instead of by sparse LU. Opt-in only: CG is accurate
+# to CG_RTOL and warm-started from the previous solve, so its results depend on the evaluation
+# history, which SLSQP's finite-difference gradients cannot tolerate
+CG_MIN_DOF = 10000
+CG_RTOL = 1e-8
+
+# Value type the reduced stiffness matrix is factorized in. float32 halves the memory traffic of the
+# LU factorization; the solve then refines the float32 solution against float64 residuals of the
+# float64 matrix until the corrections drop below REFINEMENT_RTOL (relative to the solution).
+# float64 by default: SLSQP's finite-difference gradients need the full resolution.
+STIFFNESS_DTYPE = np.float64
+REFINEMENT_RTOL = 1e-12
+MAX_REFINEMENT_STEPS = 10
+
+@dataclass(frozen=True)
+class AnalysisArrays:
+    """
+    The result columns the objective needs, as float arrays (one entry per analyzed member).
+    Built once per analysis so the metric functions don't each re-read the results.
+    """
+    element: np.ndarray
+    L: np.ndarray
+    A: np.ndarray
+    axial_force: np.ndarray
+    Pc: np.ndarray
+
+    @classmethod
+    def from_columns(cls, columns):
+        """Extracts the columns from truss_analyze_arrays' results; an empty dict (failed analysis) gives empty arrays."""
+        if not columns or len(columns['element']) == 0:
+            return cls(*(np.array([]) for _ in fields(cls)))
+        return cls(*(np.asarray(columns[f.name], dtype=float) for f in fields(cls)))
+
+    @property
+    def empty(self):
+        return self.element.size == 0
+
+    def __getitem__(self, column):
+        # Column-style access so analysis code can treat arrays and DataFrames alike
+        return getattr(self, column)
+
+def material_table(materials_df):
+    """
+    material_id -> (E, A, I), so members don't each filter materials_df.
+    Rows without a material_id column are keyed by index; the first row wins for a repeated id.
+    Ids are normalized to int and properties to float once here, rather than per member lookup.
+    """
+    ids = materials_df['material_id'] if 'material_id' in materials_df.columns else materials_df.index
+    props = [materials_df[col] if col in materials_df.columns else [default] * len(materials_df)
+             for col, default in (('E', 200e9), ('A', 0.001), ('I', 1e-6))]
+    lookup = {}
+    for mat_id, E, A, I in zip(ids, *props):
+        lookup.setdefault(int(mat_id), (float(E), float(A), float(I)))
+    return lookup
 
-    K = lil_matrix((ndof, ndof), dtype=float)
-    element_data = []
-
-    if 'material_id' not in materials_df.columns:
-        materials_df = materials_df.copy()
-        materials_df['material_id'] = materials_df.index.values
-
-    for _, row in trusses_df.iterrows():
-        eid = row['element']
-        n1 = row['start']
-        n2 = row['end']
-        i1 = id_to_idx[n1]
-        i2 = id_to_idx[n2]
-
-        p1 = points_df.loc[points_df['Node'] == n1, ['x', 'y']].iloc[0].values
-        p2 = points_df.loc[points_df['Node'] == n2, ['x', 'y']].iloc[0].values
-
-        L = sqrt((p2[0] - p1[0])**2 + (p2[1] - p1[1])**2)
-        if L == 0:
-            continue
-
-        cx = (p2[0] - p1[0]) / L
-        cy = (p2[1] - p1[1]) / L
-        
-        mat_id = row.get('material_id', 0)
-        material = materials_df.loc[materials_df['material_id'] == mat_id].iloc[0]
-        E = material.get('E', 200e9) 
-        A = material.get('A', 0.001) 
-        I = material.get('I', 1e-6)
-
-        k_local = E * A / L
-        k_global_element = k_local * np.array([
-            [cx**2, cx*cy, -cx**2, -cx*cy],
-            [cx*cy, cy**2, -cx*cy, -cy**2],
-            [-cx**2, -cx*cy, cx**2, cx*cy],
-            [-cx*cy, -cy**2, cx*cy, cy**2]
-        ])
-
-        dofs = [2*i1, 2*i1+1, 2*i2, 2*i2+1]
-        
-        for i, dof_i in enumerate(dofs):
-            for j, dof_j in enumerate(dofs):
-                K[dof_i, dof_j] += k_global_element[i, j]
-
-        element_data.append({
-            'element': eid, 'start': n1, 'end': n2, 'L': L, 'cx': cx, 'cy': cy,
-            'E': E, 'A': A, 'I': I, 'k_local': k_local
-        })
+# Layout of a member's 4x4 global stiffness matrix (DOF order x1, y1, x2, y2) in terms of
+# (kxx, kxy, kyy): the index of the entry and its sign, row-major
+_ELEMENT_ENTRY = np.array([0, 1, 0, 1, 1, 2, 1, 2, 0, 1, 0, 1, 1, 2, 1, 2])
+_ELEMENT_SIGN = np.array([1, 1, -1, -1, 1, 1, -1, -1, -1, -1, 1, 1, -1, -1, 1, 1], dtype=float)
+
+def _member_topology(points_df, trusses_df, materials_df, materials=None):
+    """
+    Everything assembly needs about the members except coordinates, as arrays: ids, the
+    endpoint rows in points_df (i1, i2) and the material properties (E, A, I).
+    """
+    id_to_idx = {nid: i for i, nid in enumerate(points_df['Node'])}
+    if materials is None:
+        materials = material_table(materials_df)
+
+    # Endpoint rows and material properties of every member; unknown ids raise KeyError
+    i1 = np.array([id_to_idx[n] for n in trusses_df['start']], dtype=int)
+    i2 = np.array([id_to_idx[n] for n in trusses_df['end']], dtype=int)
+    if 'material_id' in trusses_df.columns:
+        mat_ids = trusses_df['material_id'].to_numpy()
+    else:
+        mat_ids = np.zeros(len(trusses_df), dtype=int)
+    # Looked up once per distinct material, then broadcast to the members by index
+    unique_ids, member_material = np.unique(mat_ids, return_inverse=True)
+    properties = np.array([materials[int(m)] for m in unique_ids], dtype=float).reshape(-1, 3)
+    E, A, I = properties[member_material.ravel()].T
+
+    return {
+        'element': trusses_df['element'].to_numpy(), 'start': trusses_df['start'].to_numpy(),
+        'end': trusses_df['end'].to_numpy(), 'i1': i1, 'i2': i2, 'E': E, 'A': A, 'I': I
+    }
+
+def assemble_truss_stiffness(points_df, trusses_df, materials_df, materials=None, topology_cache=None):
+    """
+    Build global stiffness and element auxiliary data.
+    materials is an optional precomputed material_table(materials_df).
+    topology_cache (dict, optional) keeps the member arrays between calls on the same truss,
+    so only the coordinates are read from the DataFrames.
+    """
+    ndof = 2 * len(points_df)
+
+    members = topology_cache.get('members') if topology_cache is not None else None
+    if members is None:
+        members = _member_topology(points_df, trusses_df, materials_df, materials)
+        if topology_cache is not None:
+            topology_cache['members'] = members
+    i1, i2, E, A, I = (members[name] for name in ('i1', 'i2', 'E', 'A', 'I'))
+
+    # Geometry of all members at once; zero-length members are left out
+    xy = points_df[['x', 'y']].to_numpy(dtype=float)
+    d = xy[i2] - xy[i1]
+    L = np.sqrt((d * d).sum(axis=1))
+    keep = L != 0
+    i1, i2, d, L, E, A, I = i1[keep], i2[keep], d[keep], L[keep], E[keep], A[keep], I[keep]
+    cx, cy = d[:, 0] / L, d[:, 1] / L
+    k_local = E * A / L
+
+    # Element matrices k_local * [[C, -C], [-C, C]] with C = [[cx^2, cx*cy], [cx*cy, cy^2]]: only
+    # kxx, kxy and kyy are distinct, so the 16 entries per member are gathered from them with fixed signs
+    unique_entries = np.stack([cx * cx, cx * cy, cy * cy], axis=1) * k_local[:, None]
+    k_global_element = unique_entries[:, _ELEMENT_ENTRY] * _ELEMENT_SIGN
+
+    # One (row, col, value) triplet per matrix entry; duplicates are summed when converting to CSR
+    dofs = np.stack([2*i1, 2*i1+1, 2*i2, 2*i2+1], axis=1)
+    rows = np.repeat(dofs, 4, axis=1).ravel()
+    cols = np.tile(dofs, 4).ravel()
+    K = coo_matrix((k_global_element.ravel(), (rows, cols)), shape=(ndof, ndof)).tocsr()
+
+    # Per-member arrays (one entry per assembled member), including the endpoint rows i1/i2
+    element_data = {
+        'element': members['element'][keep], 'start': members['start'][keep],
+        'end': members['end'][keep], 'i1': i1, 'i2': i2, 'L': L, 'cx': cx, 'cy': cy,
+        'E': E, 'A': A, 'I': I, 'k_local': k_local
+    }
 
     return K, element_data
 
 def calculate_axial_forces_and_displacements(K, element_data, points_df, supports_df, loads_df=None):
     """Solves for displacements and axial forces."""
+    displacements, columns = solve_axial_forces(K, element_data, points_df, supports_df, loads_df)
+    return displacements, pd.DataFrame(columns)
+
+def _boundary_conditions(points_df, supports_df, loads_df=None):
+    """Load vector F (ndof x 1) and the sorted array of unrestrained DOF."""
     node_ids = list(points_df['Node'])
     id_to_idx = {nid: i for i, nid in enumerate(node_ids)}
     nnode = len(node_ids)
@@ -73,69 +154,197 @@ def calculate_axial_forces_and_displacements(K, element_data, points_df, support
 
     F = np.zeros((ndof, 1))
     
-    if loads_df is not None:
-        for _, row in loads_df.iterrows():
-            node_idx = id_to_idx[row['Node']]
-            F[2 * node_idx] += row['Fx']
-            F[2 * node_idx + 1] += row['Fy']
+    if loads_df is not None and not loads_df.empty:
+        load_rows = np.array([id_to_idx[n] for n in loads_df['Node']], dtype=np.intp)
+        # add.at accumulates repeated rows for the same node, like +=
+        np.add.at(F[:, 0], 2 * load_rows, loads_df['Fx'].to_numpy(dtype=float))
+        np.add.at(F[:, 0], 2 * load_rows + 1, loads_df['Fy'].to_numpy(dtype=float))
 
-    dof_to_keep = list(range(ndof))
-    
-    if 'Rx' not in supports_df.columns:
-        supports_df['Rx'] = 0
-    if 'Ry' not in supports_df.columns:
-        supports_df['Ry'] = 0
-    
-    for _, row in supports_df.iterrows():
-        node_idx = id_to_idx[row['Node']]
-        if row['Rx'] == 1 and (2*node_idx) in dof_to_keep:
-            dof_to_keep.remove(2*node_idx)
-        if row['Ry'] == 1 and (2*node_idx + 1) in dof_to_keep:
-            dof_to_keep.remove(2*node_idx + 1)
-            
-    K_reduced = K[np.ix_(dof_to_keep, dof_to_keep)]
+    # Restrained DOF as a mask (a missing Rx/Ry column means "free"), so each support is one
+    # indexed write instead of a search and removal in a list of all DOF
+    support_rows = np.array([id_to_idx[n] for n in supports_df['Node']], dtype=np.intp)
+    constrained = np.zeros(ndof, dtype=bool)
+    for axis, col in enumerate(['Rx', 'Ry']):
+        if col in supports_df.columns:
+            fixed = supports_df[col].to_numpy() == 1
+            constrained[2 * support_rows[fixed] + axis] = True
+    dof_to_keep = np.flatnonzero(~constrained)
+    return F, dof_to_keep
+
+def _rcm_permutation(K_reduced, topology_cache=None):
+    """Reverse Cuthill-McKee ordering of K_reduced, reused across geometries with the same topology."""
+    if topology_cache is not None:
+        perm = topology_cache.get('rcm_permutation')
+        if perm is not None and len(perm) == K_reduced.shape[0]:
+            return perm
+
+    perm = reverse_cuthill_mckee(K_reduced, symmetric_mode=True)
+    if topology_cache is not None:
+        topology_cache['rcm_permutation'] = perm
+    return perm
+
+def _solve_cg(K_reduced, F_reduced, topology_cache=None):
+    """
+    Jacobi-preconditioned CG solve of the (symmetric positive definite) reduced system.
+    Warm-started from the previous solution in topology_cache, which during optimization is
+    the displacement field of a nearby geometry. Returns None if CG does not converge.
+    """
+    x0 = topology_cache.get('cg_solution') if topology_cache is not None else None
+    if x0 is not None and len(x0) != K_reduced.shape[0]:
+        x0 = None
+    M = diags(1.0 / K_reduced.diagonal())
+    u_reduced, info = cg(K_reduced, F_reduced.ravel(), x0=x0, rtol=CG_RTOL, M=M)
+    if info != 0:
+        return None
+    if topology_cache is not None:
+        topology_cache['cg_solution'] = u_reduced
+    return u_reduced
+
+def _solve_mixed_precision(K_reduced, F_reduced):
+    """
+    Solves the float64 system K_reduced u = F_reduced with one float32 LU factorization of it and
+    iterative refinement: each residual is formed with the float64 matrix and its correction solved
+    with the float32 factors, until the corrections drop below REFINEMENT_RTOL. Falls back to a
+    float64 solve if the corrections stop shrinking first (K too ill-conditioned for float32).
+    """
+    lu = splu(K_reduced.astype(np.float32).tocsc(), permc_spec='NATURAL')
+    F_reduced = F_reduced.ravel()
+    u = lu.solve(F_reduced.astype(np.float32)).astype(float)
+    previous_step = np.inf
+    for _ in range(MAX_REFINEMENT_STEPS):
+        residual = F_reduced - K_reduced @ u
+        correction = lu.solve(residual.astype(np.float32)).astype(float)
+        u += correction
+        step = np.abs(correction).max()
+        if step <= REFINEMENT_RTOL * np.abs(u).max():
+            return u
+        if step >= previous_step:
+            break
+        previous_step = step
+    return spsolve(K_reduced, F_reduced, permc_spec='NATURAL')
+
+def solve_axial_forces(K, element_data, points_df, supports_df, loads_df=None, topology_cache=None,
+                       solve_mode='direct'):
+    """
+    Solves for displacements and axial forces.
+    Returns (displacements, columns) with the per-element results as a dict of arrays.
+    topology_cache (dict, optional) keeps the boundary conditions and the DOF ordering between
+    calls on the same truss, where only the node coordinates change.
+    solve_mode is 'direct' (sparse LU, the default), 'cg' (iterative, falling back to LU if it
+    does not converge) or 'auto' (CG from CG_MIN_DOF free DOF up).
+    """
+    if topology_cache is not None and 'boundary_conditions' in topology_cache:
+        F, dof_to_keep = topology_cache['boundary_conditions']
+    else:
+        F, dof_to_keep = _boundary_conditions(points_df, supports_df, loads_df)
+        if topology_cache is not None:
+            topology_cache['boundary_conditions'] = (F, dof_to_keep)
+    ndof = len(F)
+
+    # K is CSR (see assemble_truss_stiffness): row then column slicing, and spsolve takes it as is
+    K_reduced = K[dof_to_keep][:, dof_to_keep]
     F_reduced = F[dof_to_keep]
 
     try:
-        u_reduced = spsolve(K_reduced.tocsc(), F_reduced)
+        u_reduced = None
+        if solve_mode == 'cg' or (solve_mode == 'auto' and len(dof_to_keep) >= CG_MIN_DOF):
+            u_reduced = _solve_cg(K_reduced, F_reduced, topology_cache)
+        if u_reduced is None:
+            # Solved on the RCM-reordered system: the sparsity pattern only depends on the topology,
+            # so the fill-reducing ordering is computed once instead of by SuperLU on every solve
+            perm = _rcm_permutation(K_reduced, topology_cache)
+            K_perm, F_perm = K_reduced[perm][:, perm], F_reduced[perm]
+            if STIFFNESS_DTYPE == np.float32:
+                u_perm = _solve_mixed_precision(K_perm, F_perm)
+            else:
+                u_perm = spsolve(K_perm, F_perm, permc_spec='NATURAL')
+            u_reduced = np.empty_like(u_perm)
+            u_reduced[perm] = u_perm
     except Exception:
         u_reduced = np.zeros_like(F_reduced)
 
     displacements = np.zeros((ndof, 1))
     displacements[dof_to_keep] = u_reduced.reshape(-1, 1)
-    
-    rows = []
-    for ed in element_data:
-        i1 = id_to_idx[ed['start']]; i2 = id_to_idx[ed['end']]
-        u1x, u1y = displacements[2*i1], displacements[2*i1+1]
-        u2x, u2y = displacements[2*i2], displacements[2*i2+1]
-
-        delta_length = (u2x - u1x) * ed['cx'] + (u2y - u1y) * ed['cy']
-        axial_force = ed['k_local'] * delta_length.item()
-        
-        rows.append({
-            'element': ed['element'], 'start': ed['start'], 'end': ed['end'],
-            'L': ed['L'], 'axial_force': axial_force, 'axial_stress': axial_force / ed['A'],
-            'A': ed['A'], 'E': ed['E'], 'I': ed['I']
-        })
-    stresses_df = pd.DataFrame(rows)
-    return displacements, stresses_df
+    return displacements, _element_results(element_data, displacements)
+
+def _element_results(element_data, displacements):
+    """Per-element result columns (as in truss_analyze, without Pc) for one displacement vector."""
+    # Change in length of every member along its axis, from the end-node displacements
+    u = displacements.ravel()
+    i1, i2 = element_data['i1'], element_data['i2']
+    delta_length = (u[2*i2] - u[2*i1]) * element_data['cx'] + (u[2*i2+1] - u[2*i1+1]) * element_data['cy']
+    axial_force = element_data['k_local'] * delta_length
+
+    columns = {name: element_data[name] for name in ('element', 'start', 'end', 'L')}
+    columns.update(axial_force=axial_force, axial_stress=axial_force / element_data['A'],
+                   A=element_data['A'], E=element_data['E'], I=element_data['I'])
+    return columns
+
+def critical_buckling_forces(axial_force, E, I, L):
+    """Euler buckling load pi^2 * E * I / L^2 of each compressive member; NaN for the others."""
+    # One elementwise pass over all members (zero-length members never reach the results),
+    # instead of gathering the compressive rows and scattering Pc back
+    E, I, L = (np.asarray(values, dtype=float) for values in (E, I, L))
+    return np.where(np.asarray(axial_force, dtype=float) < 0, (pi**2 * E * I) / L**2, np.nan)
 
 def calculate_critical_buckling_force(stresses_df):
     """Calculates the critical buckling force (Pc) for each compressive member."""
-    stresses_df['Pc'] = np.nan
-    compressive_mask = stresses_df['axial_force'] < 0
-    if compressive_mask.any():
-        compressive_members = stresses_df[compressive_mask]
-        pc_values = (pi**2 * compressive_members['E'] * compressive_members['I']) / (compressive_members['L']**2)
-        stresses_df.loc[compressive_mask, 'Pc'] = pc_values
+    stresses_df['Pc'] = critical_buckling_forces(
+        stresses_df['axial_force'], stresses_df['E'], stresses_df['I'], stresses_df['L']
+    )
     return stresses_df
 
-def truss_analyze(points_df, trusses_df, supports_df, materials_df, loads_df=None):
-    """High-level function to run the full truss analysis."""
-    K, element_data = assemble_truss_stiffness(points_df, trusses_df, materials_df)
-    displacements, stresses_df = calculate_axial_forces_and_displacements(
-        K, element_data, points_df, supports_df, loads_df
+def truss_analyze_arrays(points_df, trusses_df, supports_df, materials_df, loads_df=None, materials=None,
+                         topology_cache=None, solve_mode='direct'):
+    """
+    The full truss analysis without building a results DataFrame, for repeated analyses.
+    Returns (columns, displacements): the truss_analyze result columns as a dict of arrays.
+    topology_cache is an optional dict the solver may reuse across geometries of the same truss;
+    solve_mode is passed to solve_axial_forces.
+    """
+    K, element_data = assemble_truss_stiffness(points_df, trusses_df, materials_df, materials,
+                                               topology_cache=topology_cache)
+    displacements, columns = solve_axial_forces(K, element_data, points_df, supports_df, loads_df,
+                                                topology_cache, solve_mode)
+    columns['Pc'] = critical_buckling_forces(columns['axial_force'], columns['E'], columns['I'], columns['L'])
+    return columns, displacements
+
+def truss_analyze_multi(points_df, trusses_df, supports_df, materials_df, loads_list, materials=None):
+    """
+    Analyzes several load cases (a list of loads DataFrames or None) on the same truss.
+    The stiffness matrix is assembled and factorized once and all cases are solved against it.
+    Returns a list of (columns, displacements), one per load case, as from truss_analyze_arrays.
+    """
+    if not loads_list:
+        return []
+    K, element_data = assemble_truss_stiffness(points_df, trusses_df, materials_df, materials)
+
+    # Supports are shared, so every case has the same free DOF; only the load columns differ
+    cases = [_boundary_conditions(points_df, supports_df, loads_df) for loads_df in loads_list]
+    dof_to_keep = cases[0][1]
+    F = np.hstack([F_case for F_case, _ in cases])
+    ndof = len(F)
+
+    try:
+        U_reduced = splu(K[dof_to_keep][:, dof_to_keep].tocsc()).solve(F[dof_to_keep])
+    except Exception:
+        U_reduced = np.zeros((len(dof_to_keep), len(cases)))
+
+    results = []
+    for U_case in U_reduced.T:
+        displacements = np.zeros((ndof, 1))
+        displacements[dof_to_keep] = U_case.reshape(-1, 1)
+        columns = _element_results(element_data, displacements)
+        columns['Pc'] = critical_buckling_forces(columns['axial_force'], columns['E'], columns['I'], columns['L'])
+        results.append((columns, displacements))
+    return results
+
+def truss_analyze(points_df, trusses_df, supports_df, materials_df, loads_df=None, materials=None):
+    """
+    High-level function to run the full truss analysis.
+    materials is an optional precomputed material_table(materials_df), for repeated analyses.
+    """
+    columns, displacements = truss_analyze_arrays(
+        points_df, trusses_df, supports_df, materials_df, loads_df, materials
     )
-    stresses_df = calculate_critical_buckling_force(stresses_df)
-    return stresses_df, displacements
\ No newline at end of file
+    return pd.DataFrame(columns), displacements
\ No newline at end of file
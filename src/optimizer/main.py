@@ -3,17 +3,20 @@
 import sys
 import os
 import csv
+from contextlib import contextmanager
 from datetime import datetime
 import pandas as pd
 import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_hex
 
 # Convert ALL PyQt5 imports to PySide6
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QLabel, QLineEdit, QPushButton,
                              QTableWidget, QTableWidgetItem, QAbstractItemView,
                              QMessageBox, QSlider, QTabWidget, QGridLayout, QFrame,
-                             QFileDialog, QSplitter, QCheckBox, QSizePolicy) # Added QCheckBox, QSizePolicy
-from PySide6.QtCore import Qt, QByteArray # ADDED QByteArray
+                             QFileDialog, QSplitter, QCheckBox, QSizePolicy, QComboBox, QSpinBox) # Added QCheckBox, QSizePolicy
+from PySide6.QtCore import Qt, QByteArray, QObject, QThread, Signal, Slot # ADDED QByteArray
 from PySide6.QtSvgWidgets import QSvgWidget # ADDED QSvgWidget
 
 # Refactored project imports
@@ -23,6 +26,70 @@ from .truss_model import TrussModel
 from .optimizer import optimize_truss
 from .analysis import get_objective
 
+# Matplotlib colors per theme, looked up once per draw instead of being re-derived per artist.
+# (The process-wide rcParams are left alone: the launcher hosts several windows in one process.)
+MPL_THEMES = {
+    "dark": {'bg': "#2b2b2b", 'fg': "white", 'label_bg': "black"},
+    "light": {'bg': "#ffffff", 'fg': "black", 'label_bg': "white"},
+}
+
+# Above this many members the member lines are drawn without antialiasing and rasterized in exports
+LARGE_TRUSS_MEMBERS = 100
+
+# Above this many nodes (or members, for element IDs) the ID labels are skipped unless
+# "Always Show Labels" is ticked: every label is a separate text layout on each redraw
+MAX_LABELS = 100
+
+@contextmanager
+def _batched_updates(table):
+    """Suspends repaints and signals while a table is refilled, so it repaints once at the end."""
+    table.setUpdatesEnabled(False)
+    table.blockSignals(True)
+    try:
+        yield table
+    finally:
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
+
+class OptimizerWorker(QObject):
+    """Runs optimize_truss off the GUI thread and reports back through signals."""
+    progress = Signal(int)                    # iteration number
+    finished = Signal(object, float, object)  # optimized model, final score, final metrics
+    failed = Signal(str)
+
+    def __init__(self, model, nodes_to_optimize, weights, method='SLSQP', workers=1):
+        super().__init__()
+        self.model = model
+        self.nodes_to_optimize = nodes_to_optimize
+        self.weights = weights
+        self.method = method
+        self.workers = workers
+        self._iteration = 0
+        self._cancelled = False
+
+    def cancel(self):
+        """Asks the optimizer to stop after the current iteration."""
+        self._cancelled = True
+
+    def _on_iteration(self, *args):
+        # Raising StopIteration from the callback makes SciPy return the best result so far
+        if self._cancelled:
+            raise StopIteration
+        self._iteration += 1
+        self.progress.emit(self._iteration)
+
+    @Slot()
+    def run(self):
+        try:
+            optimized_model, final_score, final_metrics = optimize_truss(
+                self.model, self.nodes_to_optimize, self.weights, workers=self.workers,
+                callback=self._on_iteration, method=self.method
+            )
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(optimized_model, final_score, final_metrics)
+
 class OptimizerApp(QMainWindow):
     """Main application window for the truss optimizer."""
     def __init__(self):
@@ -31,6 +98,8 @@ class OptimizerApp(QMainWindow):
         self.model = None
         self.current_theme = "dark" 
         self.legend_labels = {} 
+        self.optimizer_thread = None
+        self.optimizer_worker = None
         
         self.setWindowTitle("Truss Optimizer & Analysis")
         self.setGeometry(100, 100, 1400, 900)
@@ -57,6 +126,8 @@ class OptimizerApp(QMainWindow):
         self.setStyleSheet(DARK_THEME)
         self._apply_matplotlib_theme("dark") 
         self._update_legend_colors("dark") 
+        # Theme whose stylesheet is currently set; re-applying it would re-polish every widget for nothing
+        self._applied_theme = "dark"
         self.theme_button.setText("🌞 Light Mode")
 
         self.status_label.setText("Please select a design directory.")
@@ -141,9 +212,9 @@ class OptimizerApp(QMainWindow):
         self.path_line_edit = QLineEdit()
         self.path_line_edit.setReadOnly(True)
         path_layout.addWidget(self.path_line_edit)
-        select_button = QPushButton("Select...")
-        select_button.clicked.connect(self.select_design_directory)
-        path_layout.addWidget(select_button)
+        self.select_button = QPushButton("Select...")
+        self.select_button.clicked.connect(self.select_design_directory)
+        path_layout.addWidget(self.select_button)
         design_layout.addLayout(path_layout)
         layout.addWidget(design_group)
 
@@ -182,6 +253,11 @@ class OptimizerApp(QMainWindow):
         self.show_trusses_cb.setChecked(False)
         self.show_trusses_cb.stateChanged.connect(self._draw_truss)
         toggle_layout.addWidget(self.show_trusses_cb)
+
+        self.force_labels_cb = QCheckBox(f"Always Show Labels (> {MAX_LABELS} items)")
+        self.force_labels_cb.setChecked(False)
+        self.force_labels_cb.stateChanged.connect(self._draw_truss)
+        toggle_layout.addWidget(self.force_labels_cb)
         
         layout.addWidget(toggle_group)
 
@@ -197,6 +273,23 @@ class OptimizerApp(QMainWindow):
         node_layout.addWidget(self.node_table)
         layout.addWidget(node_group)
 
+        # Optimizer settings: local SLSQP or global differential evolution, and how many processes
+        # evaluate trial designs in parallel (1 = in-process)
+        settings_group = QFrame()
+        settings_layout = QGridLayout(settings_group)
+        settings_layout.addWidget(QLabel("<b>Optimizer</b>"), 0, 0, 1, 2)
+        settings_layout.addWidget(QLabel("Method:"), 1, 0)
+        self.method_combo = QComboBox()
+        self.method_combo.addItem("SLSQP (local)", 'SLSQP')
+        self.method_combo.addItem("Differential Evolution (global)", 'differential_evolution')
+        settings_layout.addWidget(self.method_combo, 1, 1)
+        settings_layout.addWidget(QLabel("Worker Processes:"), 2, 0)
+        self.workers_spin = QSpinBox()
+        self.workers_spin.setRange(1, os.cpu_count() or 1)
+        self.workers_spin.setValue(1)
+        settings_layout.addWidget(self.workers_spin, 2, 1)
+        layout.addWidget(settings_group)
+
         # Run Button and Status
         self.run_button = QPushButton("Run Optimization")
         self.run_button.clicked.connect(self.run_optimization)
@@ -297,6 +390,10 @@ class OptimizerApp(QMainWindow):
         self.apply_theme(self.current_theme)
 
     def apply_theme(self, theme_name):
+        if theme_name == self._applied_theme:
+            return
+        self._applied_theme = theme_name
+
         # 1. Apply Qt Stylesheet (Fixes issue with light mode not loading)
         self.setStyleSheet(LIGHT_THEME if theme_name == "light" else DARK_THEME)
         
@@ -311,24 +408,24 @@ class OptimizerApp(QMainWindow):
         
 
     def _apply_matplotlib_theme(self, theme_name):
-        is_dark = theme_name == "dark"
-        bg_color = "#2b2b2b" if is_dark else "#ffffff"
-        fg_color = "white" if is_dark else "black" # Text color (point labels, axes, title)
+        theme = MPL_THEMES[theme_name]
+        
+        # Nothing to restyle or redraw if the figure already has this theme's colors
+        if to_hex(self.truss_canvas.fig.get_facecolor()) == theme['bg']:
+            return
         
-        self.truss_canvas.fig.patch.set_facecolor(bg_color)
+        # Title, axis labels and truss labels take their color from _draw_truss
+        self.truss_canvas.fig.patch.set_facecolor(theme['bg'])
         ax = self.truss_canvas.axes
-        ax.set_facecolor(bg_color)
-        ax.tick_params(colors=fg_color, which="both")
-        for spine in ax.spines.values(): spine.set_color(fg_color)
-        ax.xaxis.label.set_color(fg_color)
-        ax.yaxis.label.set_color(fg_color)
-        ax.title.set_color(fg_color)
+        ax.set_facecolor(theme['bg'])
+        ax.tick_params(colors=theme['fg'], which="both")
+        for spine in ax.spines.values(): spine.set_color(theme['fg'])
         
         # Re-draw the truss to apply new label colors
         if self.model: 
             self._draw_truss()
         else: 
-            self.truss_canvas.draw()
+            self.truss_canvas.draw_idle()
         
     def select_design_directory(self):
         directory = QFileDialog.getExistingDirectory(self, "Select Design Directory")
@@ -348,11 +445,12 @@ class OptimizerApp(QMainWindow):
         """Updates all UI elements based on the current self.model state."""
         if not self.model: return
         
-        self.node_table.setRowCount(0)
-        for node_id in self.model.points['Node']:
-            row_pos = self.node_table.rowCount()
-            self.node_table.insertRow(row_pos)
-            self.node_table.setItem(row_pos, 0, QTableWidgetItem(str(node_id)))
+        node_ids = self.model.points['Node']
+        with _batched_updates(self.node_table):
+            self.node_table.setRowCount(0)
+            self.node_table.setRowCount(len(node_ids))
+            for row_pos, node_id in enumerate(node_ids):
+                self.node_table.setItem(row_pos, 0, QTableWidgetItem(str(node_id)))
 
         _, metrics = get_objective(self.model, self._get_weights())
         self._update_metrics_table(metrics)
@@ -370,6 +468,42 @@ class OptimizerApp(QMainWindow):
         ax = self.truss_canvas.axes
         ax.clear()
         
+        # Color for text labels based on theme
+        label_color = MPL_THEMES[self.current_theme]['fg']
+
+        # The truss is kept out of the cached background so _blit_truss can redraw it on its own
+        self.truss_canvas.set_animated_artists(self._add_truss_artists(ax))
+
+        ax.set_title("Truss Diagram", color=label_color)
+        ax.set_xlabel("X-coordinate (m)", color=label_color)
+        ax.set_ylabel("Y-coordinate (m)", color=label_color)
+        ax.set_aspect('equal', 'box')
+        ax.grid(True)
+        self.truss_canvas.fig.tight_layout()
+        # Repaint on the next event-loop pass, so bursts of redraw requests cost one render
+        self.truss_canvas.draw_idle()
+
+    def _blit_truss(self):
+        """
+        Redraws just the truss over the cached axes background, for when only node positions and
+        forces have changed (e.g. after an optimization run). Returns False if a full _draw_truss
+        is needed instead: nothing has been drawn yet, or the truss has moved outside the current view.
+        """
+        canvas = self.truss_canvas
+        if not self.model or not canvas.can_blit:
+            return False
+        
+        ax = canvas.axes
+        x, y = self.model.points['x'].to_numpy(), self.model.points['y'].to_numpy()
+        (x_min, x_max), (y_min, y_max) = ax.get_xlim(), ax.get_ylim()
+        if not ((x >= x_min) & (x <= x_max) & (y >= y_min) & (y <= y_max)).all():
+            return False
+        
+        canvas.replace_animated_artists(self._add_truss_artists(ax))
+        return True
+
+    def _add_truss_artists(self, ax):
+        """Adds the members, nodes, labels, supports and loads to ax and returns the created artists."""
         points_df = self.model.points
         trusses_df = self.model.trusses
         stresses_df = self.model.stresses_df
@@ -377,130 +511,132 @@ class OptimizerApp(QMainWindow):
         loads_df = self.model.loads
         
         # Color for text labels based on theme
-        label_color = "white" if self.current_theme == "dark" else "black"
-
-        # Plot members (Trusses)
-        for _, row in trusses_df.iterrows():
-            try:
-                p1 = points_df.loc[points_df['Node'] == row['start'], ['x', 'y']].values[0]
-                p2 = points_df.loc[points_df['Node'] == row['end'], ['x', 'y']].values[0]
-            except IndexError:
-                continue
-            
-            force = 0
-            try:
-                force_row = stresses_df.loc[stresses_df['element'] == row['element'], 'axial_force']
-                if not force_row.empty:
-                    force = force_row.iloc[0]
-                    color = 'blue' if force < 0 else 'red' # Compression (C) is blue, Tension (T) is red
-                else:
-                    color = 'gray'
-            except (KeyError, IndexError):
-                color = 'gray'
-            
-            ax.plot([p1[0], p2[0]], [p1[1], p2[1]], color=color, linewidth=2)
-            
-            if self.show_trusses_cb.isChecked():
-                mid_x = (p1[0] + p2[0]) / 2
-                mid_y = (p1[1] + p2[1]) / 2
-                ax.text(mid_x, mid_y, str(int(row['element'])), 
+        theme = MPL_THEMES[self.current_theme]
+        label_color = theme['fg']
+        force_labels = self.force_labels_cb.isChecked()
+        artists = []
+
+        # Node ID -> row of points_df, so member/support/load endpoints are array lookups
+        xy = points_df[['x', 'y']].to_numpy(dtype=float)
+        node_to_row = dict(zip(points_df['Node'].astype(int).to_numpy(), range(len(points_df))))
+        force_by_element = {}
+        if not stresses_df.empty and {'element', 'axial_force'} <= set(stresses_df.columns):
+            force_by_element = dict(zip(stresses_df['element'].to_numpy(), stresses_df['axial_force'].to_numpy()))
+
+        # Plot members (Trusses) as a single collection; members with an unknown node are skipped
+        start_rows = trusses_df['start'].map(node_to_row)
+        end_rows = trusses_df['end'].map(node_to_row)
+        drawn = start_rows.notna() & end_rows.notna()
+        elements = trusses_df['element'][drawn]
+        segments = np.stack([xy[start_rows[drawn].to_numpy(dtype=int)],
+                             xy[end_rows[drawn].to_numpy(dtype=int)]], axis=1)
+        forces = elements.map(force_by_element).to_numpy(dtype=float)
+        # Compression (C) is blue, Tension (T) is red, members without a result are gray
+        colors = np.where(np.isnan(forces), 'gray', np.where(forces < 0, 'blue', 'red'))
+        members = LineCollection(segments, colors=colors, linewidths=2)
+        if len(segments) > LARGE_TRUSS_MEMBERS:
+            # Large trusses: skip the antialiasing pass on screen, and write one bitmap
+            # instead of hundreds of paths when the figure is saved to a vector format
+            members.set_antialiased(False)
+            members.set_rasterized(True)
+        artists.append(ax.add_collection(members))
+        
+        if self.show_trusses_cb.isChecked() and (len(elements) <= MAX_LABELS or force_labels):
+            for element, (mid_x, mid_y) in zip(elements, segments.mean(axis=1)):
+                artists.append(ax.text(mid_x, mid_y, str(int(element)), 
                         ha='center', va='center', fontsize=6, color=label_color,
-                        bbox=dict(facecolor='black' if self.current_theme == 'dark' else 'white', 
-                                  alpha=0.7, edgecolor='none', pad=1))
+                        bbox=dict(facecolor=theme['label_bg'], 
+                                  alpha=0.7, edgecolor='none', pad=1)))
 
         # Plot nodes
-        ax.plot(points_df['x'], points_df['y'], 'o', color=label_color, zorder=5, markersize=5)
+        artists += ax.plot(points_df['x'], points_df['y'], 'o', color=label_color, zorder=5, markersize=5)
         
         # Plot node labels
-        if self.show_nodes_cb.isChecked():
+        if self.show_nodes_cb.isChecked() and (len(points_df) <= MAX_LABELS or force_labels):
             span_x = points_df['x'].max() - points_df['x'].min()
             span_y = points_df['y'].max() - points_df['y'].min()
             max_span = max(span_x, span_y) if span_x > 0 or span_y > 0 else 1
             label_offset_distance = max_span * 0.015 
             
-            for _, row in points_df.iterrows():
-                node_id = row['Node'] 
-                ax.text(row['x'] + label_offset_distance, 
-                        row['y'] + label_offset_distance, 
+            for node_id, x, y in zip(points_df['Node'].to_numpy(), points_df['x'].to_numpy(), points_df['y'].to_numpy()):
+                artists.append(ax.text(x + label_offset_distance, 
+                        y + label_offset_distance, 
                         str(int(node_id)), 
                         ha='left', va='bottom', fontsize=8, fontweight='bold', 
-                        color=label_color, zorder=8) 
+                        color=label_color, zorder=8))
 
-        # Plot supports
+        # Plot supports: one marker line per support type instead of one per support
         if not supports_df.empty and all(col in supports_df.columns for col in ['Node', 'Rx', 'Ry']):
-            for _, row in supports_df.iterrows():
-                try:
-                    node_pos = points_df.loc[points_df['Node'] == row['Node'], ['x', 'y']].values[0]
-                    
-                    Rx = row['Rx']
-                    Ry = row['Ry']
-                    
-                    if Rx == 1 and Ry == 1:
-                        # Fixed Support
-                        support_marker = 's' 
-                        color = 'green'
-                    elif (Rx == 0 and Ry == 1) or (Rx == 1 and Ry == 0):
-                        # Roller Support (in X or Y direction)
-                        support_marker = 'D'
-                        color = 'darkgreen'
-                    else:
-                        # No support or unhandled combination
-                        continue
-                        
-                    ax.plot(node_pos[0], node_pos[1], support_marker, color=color, markersize=12, zorder=6)
-                except (IndexError, KeyError) as e:
-                    print(f"Error plotting support: {e}. Check your supports data structure.")
-                    continue
+            support_rows = supports_df['Node'].map(node_to_row)
+            if support_rows.isna().any():
+                print("Error plotting support: node not found. Check your supports data structure.")
+            known = support_rows.notna().to_numpy()
+            Rx, Ry = supports_df['Rx'].to_numpy(), supports_df['Ry'].to_numpy()
+            # Fixed support: both directions restrained; roller: exactly one (in X or Y direction)
+            fixed = known & (Rx == 1) & (Ry == 1)
+            roller = known & (((Rx == 0) & (Ry == 1)) | ((Rx == 1) & (Ry == 0)))
+            for shown, support_marker, color in ((fixed, 's', 'green'), (roller, 'D', 'darkgreen')):
+                if shown.any():
+                    node_pos = xy[support_rows[shown].to_numpy(dtype=int)]
+                    artists += ax.plot(node_pos[:, 0], node_pos[:, 1], support_marker, color=color,
+                                       markersize=12, zorder=6, linestyle='none')
         else:
             print("Warning: supports_df is empty or missing 'Node', 'Rx', or 'Ry' columns. Skipping support plot.")
             
-        # Plot loads 
-        if loads_df is not None and not loads_df.empty:
-            max_truss_span = max(points_df['x'].max() - points_df['x'].min(), 
-                                points_df['y'].max() - points_df['y'].min())
+        # Plot loads as one quiver; loads on unknown nodes or with zero magnitude are skipped
+        if loads_df is not None and not loads_df.empty and 'Node' in loads_df.columns:
+            max_truss_span = np.ptp(xy, axis=0).max() if len(xy) else 0.0
             if max_truss_span <= 0: max_truss_span = 1.0
 
             arrow_scale = max_truss_span * 0.1 
-                
-            for _, row in loads_df.iterrows():
-                try:
-                    node_pos = points_df.loc[points_df['Node'] == row['Node'], ['x', 'y']].values[0]
-                    fx, fy = row.get('Fx', 0), row.get('Fy', 0)
-                    
-                    force_magnitude = np.sqrt(fx**2 + fy**2)
-                    if force_magnitude > 0:
-                        unit_fx, unit_fy = fx / force_magnitude, fy / force_magnitude
-                        arrow_dx = unit_fx * arrow_scale
-                        arrow_dy = unit_fy * arrow_scale
-                        
-                        ax.arrow(
-                            node_pos[0], node_pos[1], 
-                            arrow_dx, arrow_dy,
-                            head_width=0.05 * arrow_scale, head_length=0.075 * arrow_scale, 
-                            fc='purple', ec='purple', linewidth=2, zorder=7
-                        )
-                except IndexError:
-                    continue
-
-
-        ax.set_title("Truss Diagram", color=label_color)
-        ax.set_xlabel("X-coordinate (m)", color=label_color)
-        ax.set_ylabel("Y-coordinate (m)", color=label_color)
-        ax.set_aspect('equal', 'box')
-        ax.grid(True)
-        self.truss_canvas.fig.tight_layout()
-        self.truss_canvas.draw()
+            
+            load_rows = loads_df['Node'].map(node_to_row)
+            fx = loads_df['Fx'].to_numpy(dtype=float) if 'Fx' in loads_df.columns else np.zeros(len(loads_df))
+            fy = loads_df['Fy'].to_numpy(dtype=float) if 'Fy' in loads_df.columns else np.zeros(len(loads_df))
+            force_magnitude = np.hypot(fx, fy)
+            shown = load_rows.notna().to_numpy() & (force_magnitude > 0)
+            
+            if shown.any():
+                node_pos = xy[load_rows[shown].to_numpy(dtype=int)]
+                # Unit direction scaled so the tip lands where a head_length-capped arrow used to end
+                length = arrow_scale * 1.075
+                arrow_dx = fx[shown] / force_magnitude[shown] * length
+                arrow_dy = fy[shown] / force_magnitude[shown] * length
+                # Shaft width in data units; head sizes are multiples of it (0.05 and 0.075 of arrow_scale)
+                shaft_width = 0.01 * arrow_scale
+                artists.append(ax.quiver(
+                    node_pos[:, 0], node_pos[:, 1], arrow_dx, arrow_dy,
+                    angles='xy', scale_units='xy', scale=1, units='xy', width=shaft_width,
+                    headwidth=5, headlength=7.5, headaxislength=7.5,
+                    color='purple', edgecolor='purple', linewidth=2, zorder=7
+                ))
+                # Quivers don't take part in autoscaling, so add the arrow outlines (tip and
+                # head corners) to the data limits to keep arrows that point outward in view
+                unit = np.column_stack([arrow_dx, arrow_dy]) / length
+                normal = unit[:, ::-1] * [-1, 1]
+                tips = node_pos + unit * length
+                head_base = tips - unit * (0.075 * arrow_scale)
+                ax.update_datalim(np.vstack([tips,
+                                             head_base + normal * (0.025 * arrow_scale),
+                                             head_base - normal * (0.025 * arrow_scale)]))
+
+        return artists
         
     def _update_metrics_table(self, metrics):
-        self.metrics_table.setRowCount(len(metrics))
-        for i, (key, value) in enumerate(metrics.items()):
-            self.metrics_table.setItem(i, 0, QTableWidgetItem(key))
-            self.metrics_table.setItem(i, 1, QTableWidgetItem(f"{value:.4f}"))
-        self.metrics_table.resizeColumnsToContents()
+        with _batched_updates(self.metrics_table):
+            self.metrics_table.setRowCount(len(metrics))
+            for i, (key, value) in enumerate(metrics.items()):
+                self.metrics_table.setItem(i, 0, QTableWidgetItem(key))
+                self.metrics_table.setItem(i, 1, QTableWidgetItem(f"{value:.4f}"))
+            self.metrics_table.resizeColumnsToContents()
 
     def _update_stresses_table(self, df):
         """Populates the stresses table."""
+        with _batched_updates(self.stresses_table):
+            self._fill_stresses_table(df)
 
+    def _fill_stresses_table(self, df):
+        """Writes df (or a status message) into the stresses table; see _update_stresses_table."""
         # Check if the dataframe is empty (e.g., if analysis failed)
         if df.empty:
             self.stresses_table.setRowCount(1)
@@ -536,12 +672,15 @@ class OptimizerApp(QMainWindow):
                 self.stresses_table.setItem(i, j, item)
 
     def _update_points_table(self, points_df):
-        self.final_points_table.setRowCount(points_df.shape[0])
-        for i, row in points_df.iterrows():
-            self.final_points_table.setItem(i, 0, QTableWidgetItem(str(row['Node'])))
-            self.final_points_table.setItem(i, 1, QTableWidgetItem(f"{row['x']:.4f}"))
-            self.final_points_table.setItem(i, 2, QTableWidgetItem(f"{row['y']:.4f}"))
-        self.final_points_table.resizeColumnsToContents()
+        with _batched_updates(self.final_points_table):
+            self.final_points_table.setRowCount(points_df.shape[0])
+            # Zipped columns keep each value's own type (iterrows boxes every row into a float Series)
+            rows = zip(points_df['Node'].to_numpy(), points_df['x'].to_numpy(), points_df['y'].to_numpy())
+            for i, (node_id, x, y) in enumerate(rows):
+                self.final_points_table.setItem(i, 0, QTableWidgetItem(str(node_id)))
+                self.final_points_table.setItem(i, 1, QTableWidgetItem(f"{x:.4f}"))
+                self.final_points_table.setItem(i, 2, QTableWidgetItem(f"{y:.4f}"))
+            self.final_points_table.resizeColumnsToContents()
 
     def _get_weights(self):
         return {
@@ -563,14 +702,45 @@ class OptimizerApp(QMainWindow):
             return
 
         self.run_button.setEnabled(False)
+        self.select_button.setEnabled(False)
         self.status_label.setText("Running optimization...")
-        QApplication.processEvents()
 
         weights = self._get_weights()
         
-        optimized_model, final_score, final_metrics = optimize_truss(
-            self.model, nodes_to_optimize, weights
-        )
+        # Run the optimizer in a worker thread so the GUI stays responsive
+        self.optimizer_thread = QThread(self)
+        self.optimizer_worker = OptimizerWorker(self.model, nodes_to_optimize, weights,
+                                                method=self.method_combo.currentData(),
+                                                workers=self.workers_spin.value())
+        self.optimizer_worker.moveToThread(self.optimizer_thread)
+
+        self.optimizer_thread.started.connect(self.optimizer_worker.run)
+        self.optimizer_worker.progress.connect(self._on_optimization_progress)
+        self.optimizer_worker.finished.connect(self._on_optimization_finished)
+        self.optimizer_worker.failed.connect(self._on_optimization_failed)
+        self.optimizer_worker.finished.connect(self.optimizer_thread.quit)
+        self.optimizer_worker.failed.connect(self.optimizer_thread.quit)
+        self.optimizer_thread.finished.connect(self._on_optimization_thread_finished)
+
+        self.optimizer_thread.start()
+
+    def _on_optimization_progress(self, iteration):
+        self.status_label.setText(f"Running optimization... Iteration {iteration}")
+
+    def _on_optimization_failed(self, message):
+        self.status_label.setText(f"Optimization failed: {message}")
+        QMessageBox.warning(self, "Optimization Error", message)
+
+    def _on_optimization_thread_finished(self):
+        self.optimizer_worker.deleteLater()
+        self.optimizer_thread.deleteLater()
+        self.optimizer_worker = None
+        self.optimizer_thread = None
+        self.run_button.setEnabled(True)
+        self.select_button.setEnabled(True)
+
+    def _on_optimization_finished(self, optimized_model, final_score, final_metrics):
+        """Receives the worker's result on the GUI thread and refreshes the views."""
         self.model = optimized_model
 
         output_file = os.path.join(self.output_dir, "final_points.csv")
@@ -580,15 +750,23 @@ class OptimizerApp(QMainWindow):
         self._update_metrics_table(final_metrics)
         self._update_points_table(self.model.points)
         self._update_stresses_table(self.model.stresses_df)
-        self._draw_truss()
-        
-        self.run_button.setEnabled(True)
+        # Only positions and forces changed, so the truss can usually be blitted over the existing axes
+        if not self._blit_truss():
+            self._draw_truss()
+            # Show the final geometry right away rather than waiting for the next idle repaint
+            self.truss_canvas.draw()
 
     def closeEvent(self, event):
         """
         Overrides the default close behavior to ensure the object is
         deleted when closed, which triggers the QObject.destroyed signal.
         """
+        # Stop a running optimization before the window (and its thread) goes away
+        if self.optimizer_thread is not None:
+            self.optimizer_worker.cancel()
+            self.optimizer_thread.quit()
+            self.optimizer_thread.wait()
+
         # This is the line that makes the difference
         self.deleteLater()
         
@@ -1,10 +1,25 @@
 # truss_model.py
 
 import os
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 from . import fem_solver  # Use the new solver file
-import copy
+
+try:
+    import pyarrow  # noqa: F401 (only needed by pandas' pyarrow CSV engine)
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+@lru_cache(maxsize=32)
+def _parse_csv(path, mtime_ns):
+    """Parsed CSV, cached per path and modification time so reloading an unchanged design skips parsing."""
+    return pd.read_csv(path, engine=CSV_ENGINE)
+
+def _read_csv(path):
+    """Reads a CSV file; the result is a fresh copy the caller may modify."""
+    return _parse_csv(path, os.stat(path).st_mtime_ns).copy()
 
 class TrussModel:
     """Encapsulates all data and operations for a truss design."""
@@ -21,12 +36,30 @@ class TrussModel:
         self.initial_points = pd.DataFrame()
         self.initial_lengths = pd.Series(dtype=float)
         self.initial_forces = pd.Series(dtype=float)
+        # The same reference state as float arrays, read by the objective on every evaluation
+        self.initial_length_values = np.array([])
+        self.initial_force_values = np.array([])
 
-        # Analysis Results
-        self.stresses_df = pd.DataFrame()
+        # Node ID -> row of `points`; node IDs and row order are fixed once loaded
+        self._node_to_row = {}
+        # material_id -> (E, A, I); the materials table is fixed once loaded, so it is built
+        # once instead of on every analysis
+        self._material_table = None
+        # Solver data that only depends on the topology (member arrays, boundary conditions, DOF
+        # ordering; see fem_solver.truss_analyze_arrays); filled on the first analysis and shared by copies
+        self._topology_cache = {}
+
+        # Analysis Results: fem_solver.truss_analyze_arrays columns (see the stresses_df property
+        # for a DataFrame view)
+        self.results = {}
+        self._stresses_df = None
         self.displacements = np.array([])
         self.is_analyzed = False
 
+        # Bumped whenever node positions or analysis results change; keys the result_arrays() cache
+        self._version = 0
+        self._array_cache = (None, None)
+
     def load_from_directory(self, directory_path):
         """Loads all necessary CSV files from a given directory."""
         try:
@@ -36,12 +69,21 @@ class TrussModel:
             materials_path = os.path.join(directory_path, "materials.csv")
             loads_path = os.path.join(directory_path, "loads.csv")
             
-            self.points = pd.read_csv(points_path)
-            self.trusses = pd.read_csv(trusses_path)
-            self.supports = pd.read_csv(supports_path)
-            self.materials = pd.read_csv(materials_path)
-            self.loads = pd.read_csv(loads_path) if os.path.exists(loads_path) else None
+            self.points = _read_csv(points_path)
+            self.trusses = _read_csv(trusses_path)
+            self.supports = _read_csv(supports_path)
+            self.materials = _read_csv(materials_path)
+            self.loads = _read_csv(loads_path) if os.path.exists(loads_path) else None
+
+            # Canonical support columns, added once here rather than checked on every analysis
+            for col in ('Rx', 'Ry'):
+                if col not in self.supports.columns:
+                    self.supports[col] = 0
             
+            self._node_to_row = dict(zip(self.points['Node'], range(len(self.points))))
+            self._material_table = fem_solver.material_table(self.materials)
+            self._topology_cache = {}
+
             # Store initial state after loading
             self.initial_points = self.points.copy()
             self._calculate_initial_lengths()
@@ -50,6 +92,8 @@ class TrussModel:
             self.run_analysis()
             if not self.stresses_df.empty:
                 self.initial_forces = self.stresses_df['axial_force'].copy()
+            self.initial_length_values = self.initial_lengths.to_numpy(dtype=float)
+            self.initial_force_values = self.initial_forces.to_numpy(dtype=float)
 
             return True, "Data loaded successfully."
         except FileNotFoundError as e:
@@ -59,31 +103,74 @@ class TrussModel:
 
     def _calculate_initial_lengths(self):
         """Calculate the original length of each truss member."""
-        lengths = []
-        node_coords = self.initial_points.set_index('Node')[['x', 'y']]
-        for _, row in self.trusses.iterrows():
-            p1 = node_coords.loc[row['start']].values
-            p2 = node_coords.loc[row['end']].values
-            lengths.append(np.linalg.norm(p2 - p1))
-        self.initial_lengths = pd.Series(lengths, index=self.trusses.index)
+        # Gather both end points of every member at once; an unknown node ID raises KeyError
+        xy = self.initial_points[['x', 'y']].to_numpy(dtype=float)
+        start = np.fromiter((self._node_to_row[n] for n in self.trusses['start']), dtype=int, count=len(self.trusses))
+        end = np.fromiter((self._node_to_row[n] for n in self.trusses['end']), dtype=int, count=len(self.trusses))
+        dx, dy = (xy[end] - xy[start]).T
+        self.initial_lengths = pd.Series(np.hypot(dx, dy), index=self.trusses.index)
 
     def run_analysis(self):
         """Runs the FEM simulation on the current truss geometry."""
         try:
-            self.stresses_df, self.displacements = fem_solver.truss_analyze(
-                self.points, self.trusses, self.supports, self.materials, self.loads
+            # Arrays only: the optimizer never reads the DataFrame, so it is built on demand
+            self.results, self.displacements = fem_solver.truss_analyze_arrays(
+                self.points, self.trusses, self.supports, self.materials, self.loads,
+                materials=self._material_table, topology_cache=self._topology_cache
             )
         except Exception as e:
             print(f"Truss solver failed: {e}")
-            self.stresses_df, self.displacements = pd.DataFrame(), np.array([])
+            self.results, self.displacements = {}, np.array([])
+        self._stresses_df = None
+        self._version += 1
         self.is_analyzed = True
 
+    @property
+    def stresses_df(self):
+        """Analysis results as a DataFrame for display; built on first access after each analysis."""
+        if self._stresses_df is None:
+            self._stresses_df = pd.DataFrame(self.results)
+        return self._stresses_df
+
+    def result_arrays(self):
+        """
+        The analysis results as fem_solver.AnalysisArrays, so the objective doesn't convert
+        the DataFrame on every call. Cached until the next analysis or position update.
+        """
+        version, arrays = self._array_cache
+        if version != self._version:
+            arrays = fem_solver.AnalysisArrays.from_columns(self.results)
+            self._array_cache = (self._version, arrays)
+        return arrays
+
     def update_node_positions(self, nodes_to_optimize, new_positions_flat):
         """Updates the x, y coordinates for a given set of nodes."""
         self.is_analyzed = False # Position changed, analysis is now stale
+        self._version += 1
+        new_positions = np.asarray(new_positions_flat, dtype=float).reshape(-1, 2)
+
+        # Unknown node IDs are skipped, as before
+        rows, positions = [], []
         for i, node_id in enumerate(nodes_to_optimize):
-            self.points.loc[self.points['Node'] == node_id, ['x', 'y']] = new_positions_flat[2*i:2*i+2]
+            row = self._node_to_row.get(node_id)
+            if row is not None:
+                rows.append(row)
+                positions.append(new_positions[i])
+
+        if rows:
+            # One bulk write into a coordinate array instead of a masked .loc scan per node;
+            # assign() builds a new frame, so copies sharing the old one are unaffected
+            xy = self.points[['x', 'y']].to_numpy(dtype=float, copy=True)
+            xy[rows] = positions
+            self.points = self.points.assign(x=xy[:, 0], y=xy[:, 1])
             
     def copy(self):
-        """Creates a deep copy of the model instance."""
-        return copy.deepcopy(self)
\ No newline at end of file
+        """
+        Creates a copy of the model instance for an optimization step.
+        Nothing is cloned: update_node_positions and run_analysis replace `points` and the
+        results rather than modifying them, and the other tables are fixed after loading,
+        so the copy can share every DataFrame with the original.
+        """
+        new_model = TrussModel.__new__(TrussModel)
+        new_model.__dict__.update(self.__dict__)
+        return new_model
\ No newline at end of file
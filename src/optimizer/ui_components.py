@@ -13,6 +13,44 @@ class MplCanvas(FigureCanvas):
         super(MplCanvas, self).__init__(self.fig)
         self.setParent(parent)
 
+        # Blitting: artists marked animated are left out of full draws and painted over a cached
+        # copy of everything else, so they can be replaced without re-rendering axes, ticks and grid
+        self.animated_artists = []
+        self._background = None
+        self.mpl_connect('draw_event', self._on_draw)
+
+    @property
+    def can_blit(self):
+        """True once a full draw has cached the background for the current animated artists."""
+        return self._background is not None
+
+    def set_animated_artists(self, artists):
+        """Registers the artists to keep out of the background; it is re-cached on the next full draw."""
+        self.animated_artists = list(artists)
+        for artist in self.animated_artists:
+            artist.set_animated(True)
+        self._background = None
+
+    def replace_animated_artists(self, artists):
+        """Removes the current animated artists and blits the new ones over the cached background."""
+        for artist in self.animated_artists:
+            artist.remove()
+        self.animated_artists = list(artists)
+        for artist in self.animated_artists:
+            artist.set_animated(True)
+        self.restore_region(self._background)
+        self._draw_animated()
+        self.blit(self.fig.bbox)
+
+    def _on_draw(self, event):
+        """After a full draw (including resizes), caches the background and paints the animated artists on it."""
+        self._background = self.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        for artist in self.animated_artists:
+            self.fig.draw_artist(artist)
+
 class Mpl3DCanvas(FigureCanvas):
     """A custom class to embed a 3D Matplotlib figure into a PyQt widget."""
     def __init__(self, parent=None, width=5, height=4, dpi=100):
@@ -1,5 +1,7 @@
 # ui_themes.py
 
+import re
+
 LIGHT_THEME = """
 QMainWindow, QWidget {
     background-color: #f7f7f7;
@@ -163,4 +165,13 @@ QSlider::handle:horizontal {
     margin: -5px 0;
     border-radius: 7px;
 }
-"""
\ No newline at end of file
+"""
+
+def _compact_stylesheet(qss):
+    """Strips comments and redundant whitespace so Qt has less to parse on each theme switch."""
+    qss = re.sub(r'/\*.*?\*/', '', qss, flags=re.S)
+    return re.sub(r'\s+', ' ', qss).strip()
+
+# Compacted once at import; the strings above stay readable for editing
+LIGHT_THEME = _compact_stylesheet(LIGHT_THEME)
+DARK_THEME = _compact_stylesheet(DARK_THEME)
@@ -1,28 +1,42 @@
 # analysis.py
 
-import pandas as pd
 import numpy as np
 
-def calculate_buckling_indices(stresses_df):
+# Order of the objective terms when the weights are given as an array (see weight_vector)
+WEIGHT_KEYS = ('buckling_distribution_factor', 'buckling_penalty', 'material_usage',
+               'compressive_uniformity', 'average_force_magnitude')
+
+def weight_vector(weights):
+    """Returns the weights as a float array in WEIGHT_KEYS order; arrays are passed through unchanged."""
+    if isinstance(weights, np.ndarray):
+        return weights
+    return np.array([weights[key] for key in WEIGHT_KEYS], dtype=float)
+
+def _compressive_utilization(stresses_df):
+    """Returns |axial_force| and mu = |axial_force / Pc| for compressive members with a defined Pc."""
+    axial_force = np.asarray(stresses_df['axial_force'], dtype=float)
+    pc = np.asarray(stresses_df['Pc'], dtype=float)
+    mask = (axial_force < 0) & ~np.isnan(pc)
+    force = -axial_force[mask]
+    return force, force / np.abs(pc[mask])
+
+def calculate_buckling_indices(stresses_df, compressive=None):
     """Calculates buckling-related metrics from simulation results."""
-    compressive_members = stresses_df[stresses_df['axial_force'] < 0].copy()
-    
-    if compressive_members.empty or compressive_members['Pc'].isnull().all():
+    force, mu = compressive if compressive is not None else _compressive_utilization(stresses_df)
+
+    if force.size == 0:
         return {'buckling_distribution_factor': 0.0, 'coefficient_of_variation': 0.0}
 
-    compressive_members.dropna(subset=['Pc'], inplace=True)
-    # mu is the ratio of actual axial force to critical buckling force
-    compressive_members['mu'] = np.abs(compressive_members['axial_force'] / compressive_members['Pc'])
-    
     # Calculate Gamma (Buckling Distribution Factor component)
-    numerator = (compressive_members['mu'] * np.abs(compressive_members['axial_force'])).sum()
-    denominator = np.abs(compressive_members['axial_force']).sum()
-    gamma = numerator / denominator if denominator != 0 else 0
-    
-    # Calculate Sigma_mu (Standard Deviation component)
-    weights = np.abs(compressive_members['axial_force'])
-    variance = np.average((compressive_members['mu'] - gamma)**2, weights=weights)
-    s_mu = np.sqrt(variance)
+    # mu is the ratio of actual axial force to critical buckling force, weighted by |axial_force|
+    total_force = force.sum()
+    weighted_mu = mu * force
+    gamma = weighted_mu.sum() / total_force
+
+    # Calculate Sigma_mu (Standard Deviation component) in the same pass over the weighted sums:
+    # variance = E[mu^2] - gamma^2, clamped at 0 against rounding
+    variance = weighted_mu @ mu / total_force - gamma * gamma
+    s_mu = np.sqrt(max(variance, 0.0))
 
     # Buckling Distribution Factor (Gamma + 2 * Sigma_mu)
     buckling_distribution_factor = gamma + 2 * s_mu
@@ -35,17 +49,21 @@ def calculate_buckling_indices(stresses_df):
         'coefficient_of_variation': v_mu
     }
 
-def calculate_buckling_penalty(stresses_df, threshold=0.9):
+def calculate_buckling_penalty(stresses_df, threshold=0.9, compressive=None):
     """Calculates a penalty if any member's buckling utilization exceeds 1."""
     if stresses_df.empty:
         return 1e6 # High penalty if solver fails
     
-    compressive_members = stresses_df[stresses_df['axial_force'] < 0].copy()
-    if not compressive_members.empty:
-        compressive_members.dropna(subset=['Pc'], inplace=True)
-        mu = np.abs(compressive_members['axial_force'] / compressive_members['Pc'])
-        if np.any(mu >= 1):
-            return 100.0
+    if compressive is not None:
+        _, mu = compressive
+        overloaded = np.any(mu >= 1)
+    else:
+        # |force / Pc| >= 1 tested as |force| >= |Pc|, without building mu; NaN Pc compares False
+        axial_force = np.asarray(stresses_df['axial_force'], dtype=float)
+        pc = np.asarray(stresses_df['Pc'], dtype=float)
+        overloaded = np.any((axial_force < 0) & (np.abs(axial_force) >= np.abs(pc)))
+    if overloaded:
+        return 100.0
     return 0.0
     # """Applies a high penalty if any member exceeds a buckling utilization threshold."""
     #     compressive_members = stresses_df[stresses_df['axial_force'] < 0]
@@ -69,48 +87,53 @@ def calculate_buckling_penalty(stresses_df, threshold=0.9):
 def normalized_material_usage(stresses_df, initial_lengths):
     """Calculates the ratio of current material usage (Volume) to initial usage."""
     # Volume = sum(Length * Area)
-    current_volume = (stresses_df['L'] * stresses_df['A']).sum()
-    initial_volume = (initial_lengths * stresses_df['A'].head(len(initial_lengths))).sum()
+    L = np.asarray(stresses_df['L'], dtype=float)
+    A = np.asarray(stresses_df['A'], dtype=float)
+    initial_lengths = np.asarray(initial_lengths, dtype=float)
+    n = min(len(initial_lengths), len(A))
+    current_volume = L @ A
+    initial_volume = initial_lengths[:n] @ A[:n]
     
     return current_volume / initial_volume if initial_volume > 0 else 1.0
 
 def normalized_average_force(stresses_df, initial_forces):
     """Calculates the ratio of current average absolute force to initial average force."""
-    avg_force = np.mean(np.abs(stresses_df['axial_force']))
-    initial_avg_force = np.mean(np.abs(initial_forces))
+    avg_force = np.mean(np.abs(np.asarray(stresses_df['axial_force'], dtype=float)))
+    initial_avg_force = np.mean(np.abs(np.asarray(initial_forces, dtype=float)))
     return avg_force / initial_avg_force if initial_avg_force > 0 else 0
 
 def get_objective(model, weights):
     """
     Combines all metrics from a TrussModel into a single objective score.
+    weights is a dict or a weight_vector array.
     """
     if not model.is_analyzed:
         model.run_analysis()
     
-    stresses_df = model.stresses_df
+    results = model.results
     
-    if stresses_df.empty:
+    if results.empty:
         # Return a very high score if analysis failed
         return 1e9, {'Total Score': 1e9, 'Buckling Distribution Factor': 0.0, 'Compression Uniformity': 0.0, 'Material Usage Ratio': 1.0, 'Buckling Penalty': 1.0}
     
+    # The buckling metrics share one compressive mask and utilization array
+    compressive = _compressive_utilization(results)
+
     # Calculate all individual metric scores
-    buckling_metrics = calculate_buckling_indices(stresses_df)
-    buckling_penalty = calculate_buckling_penalty(stresses_df)
-    material_usage = normalized_material_usage(stresses_df, model.initial_lengths)
-    avg_force = normalized_average_force(stresses_df, model.initial_forces)
-    
-    # Combine scores using weights
-    unnormalized_score = (
-        buckling_metrics['buckling_distribution_factor'] * weights['buckling_distribution_factor'] +
-        buckling_penalty * weights['buckling_penalty'] +
-        material_usage * weights['material_usage'] +
-        buckling_metrics['coefficient_of_variation'] * weights['compressive_uniformity'] +
-        avg_force * weights['average_force_magnitude']
-    )
-
-    total_weight = sum(weights.values())
+    buckling_metrics = calculate_buckling_indices(results, compressive)
+    buckling_penalty = calculate_buckling_penalty(results, compressive=compressive)
+    material_usage = normalized_material_usage(results, model.initial_lengths)
+    avg_force = normalized_average_force(results, model.initial_forces)
+
+    # Combine scores using weights (terms in WEIGHT_KEYS order)
+    weights = weight_vector(weights)
+    terms = np.array([buckling_metrics['buckling_distribution_factor'], buckling_penalty, material_usage,
+                      buckling_metrics['coefficient_of_variation'], avg_force])
+    unnormalized_score = terms @ weights
+
+    total_weight = weights.sum()
     score = unnormalized_score / total_weight if total_weight > 0 else float('inf')
-    
+
     # Bundle metrics for display
     metrics = {
         'Total Score': score,
@@ -120,5 +143,5 @@ def get_objective(model, weights):
         'Buckling Penalty': buckling_penalty,
         'Average Force Ratio': avg_force
     }
-    
+
     return score, metrics
@@ -2,137 +2,165 @@
 
 import numpy as np
 import pandas as pd
-from math import sqrt, pi
-from scipy.sparse import lil_matrix
-from scipy.sparse.linalg import spsolve
+from dataclasses import dataclass, fields
+from math import pi
+from scipy.sparse import coo_matrix
+from scipy.sparse.linalg import splu, onenormest, LinearOperator, norm as sparse_norm
+from scipy.sparse.csgraph import reverse_cuthill_mckee
 
-def assemble_truss_stiffness(points_df, trusses_df, materials_df):
-    """Build global stiffness and element auxiliary data for a 3D truss."""
-    node_ids = list(points_df['Node'])
-    nnode = len(node_ids)
-    # The canonical mapping used for K and the global displacement vector
-    id_to_idx = {nid: i for i, nid in enumerate(node_ids)}
-    
-    # CRITICAL FIX: 3 Degrees of Freedom (DOF) per node: u_x, u_y, u_z
-    ndof = 3 * nnode 
-
-    K = lil_matrix((ndof, ndof), dtype=float)
-    element_data = []
-    
-    # Create a material lookup table indexed by row index (material_id)
-    material_lookup = materials_df.set_index(materials_df.index)
-
-    for _, row in trusses_df.iterrows():
-        eid = row['element']
-        n1 = row['start']
-        n2 = row['end']
-        i1 = id_to_idx[n1]
-        i2 = id_to_idx[n2]
-
-        # Retrieve x, y, and z coordinates for 3D analysis
-        p1 = points_df.loc[points_df['Node'] == n1, ['x', 'y', 'z']].iloc[0].values
-        p2 = points_df.loc[points_df['Node'] == n2, ['x', 'y', 'z']].iloc[0].values
-
-        dx = p2[0] - p1[0]
-        dy = p2[1] - p1[1]
-        dz = p2[2] - p1[2]
-
-        L = sqrt(dx**2 + dy**2 + dz**2)
-        
-        # Calculate direction cosines
-        cx = dx / L
-        cy = dy / L
-        cz = dz / L
-        
-        # Robust Material Lookup by Index
-        material_idx = row['material_id']
-        if material_idx not in material_lookup.index:
-            material = material_lookup.iloc[0]
-        else:
-            material = material_lookup.loc[material_idx] 
-            
-        E = material['E']
-        A = material['A']
-        I = material['I'] # Used for buckling check
-
-        # Element stiffness in local coordinates (k_local)
-        k_local = (A * E) / L
-
-        # Direction cosine vector (3 components)
-        c = np.array([cx, cy, cz])
-        
-        # Element stiffness matrix in global coordinates (6x6 matrix for 3D truss)
-        C_matrix = np.outer(c, c) 
-        K_e = np.zeros((6, 6))
-        
-        # Populate the 4 quadrants of the 6x6 element stiffness matrix
-        K_e[0:3, 0:3] = k_local * C_matrix
-        K_e[0:3, 3:6] = -k_local * C_matrix
-        K_e[3:6, 0:3] = -k_local * C_matrix
-        K_e[3:6, 3:6] = k_local * C_matrix
-
-        # Global DOF indices for this element (i1: start node, i2: end node)
-        # Note: 3*i maps to ux, 3*i+1 maps to uy, 3*i+2 maps to uz
-        dof = [3*i1, 3*i1+1, 3*i1+2, 3*i2, 3*i2+1, 3*i2+2]
-
-        # Add element stiffness to global matrix K
-        for r_local, r_global in enumerate(dof):
-            for c_local, c_global in enumerate(dof):
-                K[r_global, c_global] += K_e[r_local, c_local] 
-
-        # Store auxiliary data
-        element_data.append({
-            'element': eid, 'start': n1, 'end': n2, 'L': L, 
-            'cx': cx, 'cy': cy, 'cz': cz, 'E': E, 'A': A, 'I': I, 
-            'k_local': k_local, 'dof': dof
-        })
-
-    return K, element_data, ndof
-
-def solve_system(K, supports_df, loads_df, points_df, ndof):
-    """Applies boundary conditions and solves for displacements."""
-    
-    # Ensure node indexing is canonical (from points_df)
-    node_ids = list(points_df['Node'])
-    id_to_idx = {nid: i for i, nid in enumerate(node_ids)}
-    
-    # 1. Initialize Force vector F
+# Solve in float32 when the reduced stiffness matrix is well conditioned enough for it.
+# Off by default: SLSQP's finite-difference gradients need the full float64 resolution.
+SINGLE_PRECISION_SOLVE = False
+SINGLE_PRECISION_MAX_COND = 1e4
+# Above this (estimated) condition number the structure is treated as a mechanism
+MAX_COND = 1e12
+
+@dataclass
+class StressResults:
+    """
+    Per-element analysis results as NumPy arrays, one entry per truss member.
+    The optimizer works on these arrays directly; to_dataframe() is meant for the UI layer.
+    """
+    element: np.ndarray
+    start: np.ndarray
+    end: np.ndarray
+    L: np.ndarray
+    axial_force: np.ndarray
+    axial_stress: np.ndarray
+    A: np.ndarray
+    E: np.ndarray
+    I: np.ndarray
+    Pc: np.ndarray
+
+    @classmethod
+    def empty_results(cls):
+        """Results of a failed or not yet run analysis."""
+        return cls(*(np.array([]) for _ in fields(cls)))
+
+    @property
+    def empty(self):
+        return self.element.size == 0
+
+    def __getitem__(self, column):
+        # Column-style access so analysis code can treat results and DataFrames alike
+        return getattr(self, column)
+
+    def to_dataframe(self):
+        """Converts the results to a DataFrame (empty if the analysis produced no results)."""
+        if self.empty:
+            return pd.DataFrame()
+        return pd.DataFrame({f.name: getattr(self, f.name) for f in fields(self)})
+
+def element_material_properties(trusses_df, materials_df):
+    """
+    Per-element material arrays aligned with the rows of trusses_df.
+    These only depend on the topology and materials, so build_topology computes them once
+    for every geometry (or takes them precomputed).
+    """
+    # Robust Material Lookup by Index (material_id); unknown ids fall back to the first material
+    material_rows = materials_df.index.get_indexer(trusses_df['material_id'].to_numpy())
+    material_rows[material_rows < 0] = 0
+
+    E = materials_df['E'].to_numpy(dtype=float)[material_rows]
+    A = materials_df['A'].to_numpy(dtype=float)[material_rows]
+    I = materials_df['I'].to_numpy(dtype=float)[material_rows] # Used for buckling check
+
+    # Numerator of the Euler buckling load, Pc = pi^2 * E * I / L^2
+    return {'E': E, 'A': A, 'I': I, 'pi2EI': pi**2 * E * I}
+
+def element_geometry(coords, start_rows, end_rows):
+    """
+    Lengths and direction cosines of all members at once.
+    coords is an (n_nodes, 3) array; start_rows/end_rows give each member's endpoint rows.
+    Returns (L, cosines) with cosines of shape (n_elements, 3) holding [cx, cy, cz].
+    """
+    d = coords[end_rows] - coords[start_rows]
+    L = np.sqrt((d * d).sum(axis=1))
+    return L, d / L[:, None]
+
+def assemble_truss_stiffness(coords, topology):
+    """
+    Global stiffness matrix (CSR) of the truss at the given node coordinates, all members at once.
+    coords is the (n_nodes, 3) coordinate array and topology comes from build_topology.
+    Returns (K, L, cosines, k_local): the matrix and the member lengths, direction cosines and
+    axial stiffnesses A*E/L it was built from.
+    """
+    props = topology['properties']
+    ndof = topology['ndof']
+    L, cosines = element_geometry(coords, topology['start_rows'], topology['end_rows'])
+    k_local = props['A'] * props['E'] / L
+
+    # Element stiffness matrices k * [[C, -C], [-C, C]] with C = c c^T, stacked as (n_elements, 6, 6)
+    C = k_local[:, None, None] * cosines[:, :, None] * cosines[:, None, :]
+    K_e = np.block([[C, -C], [-C, C]])
+
+    # Scatter-add all element blocks at once (duplicate entries are summed)
+    dof = topology['element_dof']
+    rows = np.repeat(dof, 6, axis=1).ravel()
+    cols = np.tile(dof, (1, 6)).ravel()
+    K = coo_matrix((K_e.ravel(), (rows, cols)), shape=(ndof, ndof)).tocsr()
+
+    return K, L, cosines, k_local
+
+def _rcm_permutation(K_red, topology_cache=None):
+    """Reverse Cuthill-McKee ordering of K_red, reused across geometries with the same topology."""
+    if topology_cache is not None:
+        perm = topology_cache.get('rcm_permutation')
+        if perm is not None and len(perm) == K_red.shape[0]:
+            return perm
+
+    perm = reverse_cuthill_mckee(K_red.tocsr(), symmetric_mode=True)
+    if topology_cache is not None:
+        topology_cache['rcm_permutation'] = perm
+    return perm
+
+def _boundary_conditions(id_to_idx, supports_df, loads_df, ndof):
+    """
+    Load vector F (ndof) and the sorted array of free DOF, from whole columns at once.
+    Loads and supports on nodes missing from id_to_idx are ignored; missing Fx/Fy/Fz or
+    Rx/Ry/Rz columns count as zero load and free.
+    """
     F = np.zeros(ndof)
-    
-    # Apply loads
     if loads_df is not None and not loads_df.empty:
-        for _, row in loads_df.iterrows():
-            node_idx = id_to_idx.get(row['Node'])
-            if node_idx is not None:
-                # Fx: 3*idx, Fy: 3*idx+1, Fz: 3*idx+2
-                F[3 * node_idx] += row.get('Fx', 0.0)
-                F[3 * node_idx + 1] += row.get('Fy', 0.0)
-                F[3 * node_idx + 2] += row.get('Fz', 0.0)
-
-    # 2. Identify constrained DOF
-    constrained_dof = []
-    
-    for _, row in supports_df.iterrows():
-        node_idx = id_to_idx.get(row['Node'])
-        if node_idx is not None:
-            # Check for supports in x, y, and z directions (3 DOF per node)
-            if row.get('Rx', 0) == 1: # NOTE: Using Rx, Ry, Rz from supports.csv
-                constrained_dof.append(3 * node_idx)
-            if row.get('Ry', 0) == 1:
-                constrained_dof.append(3 * node_idx + 1)
-            if row.get('Rz', 0) == 1:
-                constrained_dof.append(3 * node_idx + 2)
-
-    all_dof = set(range(ndof))
-    free_dof = sorted(list(all_dof - set(constrained_dof)))
-    
-    # Check for rigid body motion (minimum 6 constraints needed)
-    if ndof > 0 and len(constrained_dof) < 6:
-        pass # The singular matrix check below is more robust
-
-    if not free_dof:
+        load_rows = np.array([id_to_idx.get(n, -1) for n in loads_df['Node']], dtype=np.intp)
+        known = load_rows >= 0
+        for axis, col in enumerate(['Fx', 'Fy', 'Fz']):
+            if col in loads_df.columns:
+                # add.at accumulates repeated rows for the same node, like +=
+                np.add.at(F, 3 * load_rows[known] + axis, loads_df[col].to_numpy(dtype=float)[known])
+
+    support_rows = np.array([id_to_idx.get(n, -1) for n in supports_df['Node']], dtype=np.intp)
+    constrained = np.zeros(ndof, dtype=bool)
+    for axis, col in enumerate(['Rx', 'Ry', 'Rz']):
+        if col in supports_df.columns:
+            fixed = (supports_df[col].to_numpy() == 1) & (support_rows >= 0)
+            constrained[3 * support_rows[fixed] + axis] = True
+
+    return F, np.flatnonzero(~constrained)
+
+def _factorize(K):
+    """Sparse LU factorization of K (CSC, already reordered). A singular K fails to factorize (ValueError)."""
+    try:
+        return splu(K, permc_spec='NATURAL')
+    except RuntimeError:
+        raise ValueError("Global stiffness matrix is singular or ill-conditioned. Structure is likely a mechanism or improperly supported.")
+
+def _condition_estimate(K, lu):
+    """
+    1-norm condition number estimate ||K||_1 * ||K^-1||_1, with ||K^-1||_1 estimated by onenormest
+    through the LU factors (a few extra solves) instead of a dense cond() on every analysis.
+    K is symmetric, so K^-1 is too and the same solve serves for its transpose.
+    """
+    def solve(b):
+        return lu.solve(np.asarray(b, dtype=K.dtype))
+    K_inv = LinearOperator(K.shape, matvec=solve, rmatvec=solve, matmat=solve, rmatmat=solve, dtype=K.dtype)
+    return sparse_norm(K, 1) * onenormest(K_inv)
+
+def _solve_free_dof(K, F, free_dof, ndof, topology_cache=None):
+    """Solves K U = F on the free DOF (all others fixed at zero) and returns the full displacement vector."""
+    if len(free_dof) == 0:
         # Structure is fully fixed, no displacements possible
-        return np.zeros(ndof), free_dof
+        return np.zeros(ndof)
 
     # 3. Reduce K and F
     K_red = K.tocsr()[free_dof, :].tocsc()[:, free_dof]
@@ -141,99 +169,128 @@ def solve_system(K, supports_df, loads_df, points_df, ndof):
     # Check for mechanism/singularity after reduction
     if K_red.shape[0] != K_red.shape[1] or K_red.shape[0] == 0:
          raise ValueError("Reduced stiffness matrix has invalid dimensions.")
-    
-    # Robust singularity check
-    try:
-        cond_num = np.linalg.cond(K_red.todense())
-        if cond_num > 1e12:
-             raise ValueError(f"Global stiffness matrix is singular or ill-conditioned. Condition Number: {cond_num:.2e}. Structure is likely a mechanism or improperly supported.")
-    except:
-         # Handle case where dense conversion fails or numpy errors out on singular matrix
-         raise ValueError("Global stiffness matrix is singular or ill-conditioned. Structure is likely a mechanism or improperly supported.")
-
 
-    # 4. Solve K_red * U_red = F_red
-    U_red = spsolve(K_red, F_red)
+    # 4. Solve K_red * U_red = F_red on the RCM-reordered system to limit fill-in; the sparse LU
+    # factorization doubles as the singularity check (see _factorize and _condition_estimate). float32 is tried first
+    # when enabled and kept only if the system is well conditioned enough for it
+    perm = _rcm_permutation(K_red, topology_cache)
+    K_perm = K_red[perm, :][:, perm].tocsc()
+    F_perm = F_red[perm]
+    U_perm = None
+    if SINGLE_PRECISION_SOLVE:
+        try:
+            K_single = K_perm.astype(np.float32)
+            lu = _factorize(K_single)
+            if _condition_estimate(K_single, lu) < SINGLE_PRECISION_MAX_COND:
+                U_perm = lu.solve(F_perm.astype(np.float32)).astype(float)
+        except ValueError:
+            pass  # singular in float32; the float64 factorization decides
+    if U_perm is None:
+        lu = _factorize(K_perm)
+        cond_estimate = _condition_estimate(K_perm, lu)
+        if cond_estimate > MAX_COND:
+             raise ValueError(f"Global stiffness matrix is singular or ill-conditioned. Condition Number estimate: {cond_estimate:.2e}. Structure is likely a mechanism or improperly supported.")
+        U_perm = lu.solve(F_perm)
+    U_red = np.empty_like(U_perm)
+    U_red[perm] = U_perm
 
     # 5. Expand solution to full displacement vector
     displacements = np.zeros(ndof)
-    for i, dof in enumerate(free_dof):
-        displacements[dof] = U_red[i]
+    displacements[free_dof] = U_red
         
-    return displacements, free_dof
+    return displacements
 
-def calculate_element_forces(displacements, element_data, points_df):
-    """Calculates internal forces and stresses for 3D truss elements."""
-    rows = []
-    
-    # Ensure node indexing is canonical (from points_df)
-    node_ids = list(points_df['Node'])
-    id_to_idx = {nid: i for i, nid in enumerate(node_ids)}
-    
-    for ed in element_data:
-        n1 = ed['start']
-        n2 = ed['end']
-        
-        # Use the canonical map
-        i1 = id_to_idx[n1] 
-        i2 = id_to_idx[n2]
-
-        # Element displacement vector (3 DOF per node)
-        # FIX: Ensure all 3 DOFs are correctly extracted
-        u1x = displacements[3*i1]
-        u1y = displacements[3*i1+1]
-        u1z = displacements[3*i1+2]
-        u2x = displacements[3*i2]
-        u2y = displacements[3*i2+1]
-        u2z = displacements[3*i2+2]
-
-        # Change in length (dot product of displacement vector with direction cosines)
-        delta_length = (u2x - u1x) * ed['cx'] + (u2y - u1y) * ed['cy'] + (u2z - u1z) * ed['cz']
-        
-        # Axial force F = k_local * delta_length
-        axial_force = ed['k_local'] * delta_length
-        
-        rows.append({
-            'element': ed['element'], 'start': n1, 'end': n2,
-            'L': ed['L'], 'axial_force': axial_force, 'axial_stress': axial_force / ed['A'],
-            'A': ed['A'], 'E': ed['E'], 'I': ed['I']
-        })
-        
-    stresses_df = pd.DataFrame(rows)
-    return stresses_df
-
-def calculate_critical_buckling_force(stresses_df):
+def calculate_critical_buckling_force(results, pi2EI=None):
     """Calculates the critical buckling force (Pc) for each compressive member."""
-    stresses_df['Pc'] = np.nan
-    compressive_mask = stresses_df['axial_force'] < 0
-    if compressive_mask.any():
-        compressive_members = stresses_df[compressive_mask]
-        # Pc = (pi^2 * E * I) / L^2
-        pc_values = (pi**2 * compressive_members['E'] * compressive_members['I']) / (compressive_members['L']**2)
-        stresses_df.loc[compressive_mask, 'Pc'] = pc_values
-    return stresses_df
-
-def truss_analyze(points_df, trusses_df, supports_df, materials_df, loads_df=None):
-    """Main function to perform 3D static truss analysis."""
+    if pi2EI is None:
+        pi2EI = pi**2 * results.E * results.I
+    # Pc = (pi^2 * E * I) / L^2
+    results.Pc = np.where(results.axial_force < 0, pi2EI / results.L**2, np.nan)
+    return results
+
+def truss_analyze(points_df, trusses_df, supports_df, materials_df, loads_df=None, element_properties=None):
+    """
+    Main function to perform 3D static truss analysis on DataFrames.
+    Builds the topology and runs truss_analyze_fast on points_df's coordinates; callers that
+    analyze many geometries of one truss keep the build_topology result and call
+    truss_analyze_fast directly (as TrussModel does).
+    element_properties (from element_material_properties) may be passed to skip the material lookup.
+    Returns (StressResults, displacements).
+    """
     if 'z' not in points_df.columns:
         # Check to ensure 3D is possible
         raise ValueError("3D Analysis requires 'z' column in points.csv.")
 
     try:
-        K, element_data, ndof = assemble_truss_stiffness(points_df, trusses_df, materials_df)
-        
-        # Pass points_df to solve_system for consistent node indexing
-        displacements, _ = solve_system(K, supports_df, loads_df, points_df, ndof) 
-        
-        # Pass points_df to calculate_element_forces for consistent node indexing
-        stresses_df = calculate_element_forces(displacements, element_data, points_df)
-        stresses_df = calculate_critical_buckling_force(stresses_df)
-        
-        return stresses_df, displacements
-        
+        topology = build_topology(points_df, trusses_df, supports_df, materials_df, loads_df, element_properties)
+    except Exception as e:
+        print(f"An unexpected error occurred in the 3D Truss solver: {e}")
+        return StressResults.empty_results(), np.array([])
+    return truss_analyze_fast(points_df[['x', 'y', 'z']].to_numpy(dtype=float), topology)
+
+def build_topology(points_df, trusses_df, supports_df, materials_df, loads_df=None, element_properties=None):
+    """
+    Collects everything about a truss except its node coordinates as NumPy arrays, for truss_analyze_fast.
+    Only points_df's node IDs and row order are used, so the result stays valid while nodes move.
+    The returned dict also serves as the topology cache for the solver (e.g. the DOF ordering).
+    """
+    node_ids = list(points_df['Node'])
+    id_to_idx = {nid: i for i, nid in enumerate(node_ids)}
+    ndof = 3 * len(node_ids)
+
+    if element_properties is None:
+        element_properties = element_material_properties(trusses_df, materials_df)
+    start_rows = np.array([id_to_idx[n] for n in trusses_df['start']], dtype=np.intp)
+    end_rows = np.array([id_to_idx[n] for n in trusses_df['end']], dtype=np.intp)
+
+    # Global DOF indices per element: [ux1, uy1, uz1, ux2, uy2, uz2]
+    element_dof = np.hstack([3 * start_rows[:, None] + np.arange(3), 3 * end_rows[:, None] + np.arange(3)])
+
+    F, free_dof = _boundary_conditions(id_to_idx, supports_df, loads_df, ndof)
+
+    return {
+        'element': trusses_df['element'].to_numpy(dtype=int),
+        'start': trusses_df['start'].to_numpy(dtype=int),
+        'end': trusses_df['end'].to_numpy(dtype=int),
+        'start_rows': start_rows,
+        'end_rows': end_rows,
+        'element_dof': element_dof,
+        'properties': element_properties,
+        'F': F,
+        'free_dof': free_dof,
+        'ndof': ndof,
+    }
+
+def truss_analyze_fast(coords, topology):
+    """
+    3D static truss analysis on arrays only: coords is the (n_nodes, 3) coordinate array and
+    topology comes from build_topology.
+    Returns (StressResults, displacements).
+    """
+    try:
+        props = topology['properties']
+        ndof = topology['ndof']
+        K, L, cosines, k_local = assemble_truss_stiffness(coords, topology)
+
+        displacements = _solve_free_dof(K, topology['F'], topology['free_dof'], ndof, topology)
+
+        # Axial force F = k_local * (change in length along the member axis)
+        U = displacements.reshape(-1, 3)
+        delta_length = ((U[topology['end_rows']] - U[topology['start_rows']]) * cosines).sum(axis=1)
+        axial_force = k_local * delta_length
+
+        results = StressResults(
+            element=topology['element'], start=topology['start'], end=topology['end'],
+            L=L, axial_force=axial_force, axial_stress=axial_force / props['A'],
+            A=props['A'], E=props['E'], I=props['I'], Pc=np.full(len(L), np.nan)
+        )
+        results = calculate_critical_buckling_force(results, props['pi2EI'])
+
+        return results, displacements
+
     except ValueError as e:
         print(f"3D Truss solver failed: {e}")
-        return pd.DataFrame(), np.array([])
+        return StressResults.empty_results(), np.array([])
     except Exception as e:
         print(f"An unexpected error occurred in the 3D Truss solver: {e}")
-        return pd.DataFrame(), np.array([])
+        return StressResults.empty_results(), np.array([])
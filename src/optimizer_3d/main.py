@@ -6,21 +6,78 @@ import csv
 from datetime import datetime
 import pandas as pd
 import numpy as np
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 
 # Convert ALL PyQt5 imports to PySide6
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QLabel, QLineEdit, QPushButton,
-                             QTableWidget, QTableWidgetItem, QAbstractItemView,
+                             QTableWidget, QTableWidgetItem, QTableView, QAbstractItemView,
                              QMessageBox, QSlider, QTabWidget, QGridLayout, QFrame,
-                             QFileDialog, QSplitter, QCheckBox, QSizePolicy) 
-from PySide6.QtCore import Qt, QByteArray 
+                             QFileDialog, QSplitter, QCheckBox, QSizePolicy, QComboBox, QSpinBox) 
+from PySide6.QtCore import Qt, QByteArray, QObject, QThread, QTimer, Signal, Slot
 
 # Refactored project imports
 from .ui_themes import LIGHT_THEME, DARK_THEME
-from .ui_components import Mpl3DCanvas # Now imports the 3D canvas with zoom
+from .ui_components import Mpl3DCanvas, ArrayTableModel # Now imports the 3D canvas with zoom
 from .truss_model import TrussModel
 from .optimizer import optimize_truss
-from .analysis import get_objective
+from .analysis import get_objective, WEIGHT_KEYS
+
+# Weight slider label -> objective weight key
+WEIGHT_SLIDER_KEYS = {
+    "Buckling Distribution Factor": 'buckling_distribution_factor',
+    "Buckling Penalty": 'buckling_penalty',
+    "Material Usage": 'material_usage',
+    "Compression Uniformity": 'compressive_uniformity',
+    "Average Force Magnitude": 'average_force_magnitude',
+}
+
+# Above this many nodes, only supported and loaded nodes are labelled (text artists are slow to draw)
+MAX_NODE_LABELS = 200
+
+class OptimizerWorker(QObject):
+    """Runs optimize_truss off the GUI thread and reports back through signals."""
+    progress = Signal(int)                    # iteration number
+    finished = Signal(object, float, object, bool)  # optimized model (None if not improved), final score, final metrics, cancelled
+    failed = Signal(str)
+
+    def __init__(self, model, nodes_to_optimize, weights, method='SLSQP', workers=1):
+        super().__init__()
+        # The worker only sees copies, so the GUI can keep using (and replacing) its own model
+        self.model = model.copy()
+        self.nodes_to_optimize = list(nodes_to_optimize)
+        self.weights = dict(weights)
+        self.method = method
+        self.workers = workers
+        self._iteration = 0
+        self._cancelled = False
+
+    def cancel(self):
+        """Asks the optimizer to stop after the current iteration."""
+        self._cancelled = True
+
+    def _on_iteration(self, *args):
+        # Raising StopIteration from the callback makes SciPy return the best result so far
+        if self._cancelled:
+            raise StopIteration
+        self._iteration += 1
+        self.progress.emit(self._iteration)
+
+    @Slot()
+    def run(self):
+        try:
+            initial_score, _ = get_objective(self.model, self.weights)
+            optimized_model, final_score, final_metrics = optimize_truss(
+                self.model, self.nodes_to_optimize, self.weights, method=self.method,
+                workers=self.workers, callback=self._on_iteration
+            )
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        # A cancelled run stops at an arbitrary iterate, which is only worth keeping if it improved the design
+        if self._cancelled and not final_score < initial_score:
+            optimized_model = None
+        self.finished.emit(optimized_model, final_score, final_metrics, self._cancelled)
 
 class OptimizerApp(QMainWindow):
     """Main application window for the 3D truss optimizer."""
@@ -30,6 +87,10 @@ class OptimizerApp(QMainWindow):
         self.model = None
         self.current_theme = "dark" 
         self.legend_labels = {} 
+        self.force_node_labels = False # Label every node regardless of MAX_NODE_LABELS (see force_labels_cb)
+        self._node_labels = {} # Node ID -> its label Text artist, moved rather than recreated on redraws
+        self._static_axes_ready = False # Axis labels and title are in place; redraws only swap the truss artists
+        self._dirty = set() # Panels to refresh at the end of the current handler (see _flush_ui)
         
         self.setWindowTitle("3D Truss Optimizer & Analysis")
         self.setGeometry(100, 100, 1400, 900)
@@ -39,6 +100,16 @@ class OptimizerApp(QMainWindow):
         
         # Dictionary to hold QLineEdits for easy access to weight values
         self.weight_inputs = {}
+        # Slider ticks are coalesced: only the latest value per slider is applied after a short pause
+        self._pending_weights = {}
+        self._weight_timer = QTimer(self)
+        self._weight_timer.setSingleShot(True)
+        self._weight_timer.setInterval(50)
+        self._weight_timer.timeout.connect(self._apply_weights)
+
+        # Background optimization (see _run_optimization)
+        self.optimizer_thread = None
+        self.optimizer_worker = None
 
         self._init_ui()
         self.apply_theme(self.current_theme)
@@ -74,13 +145,40 @@ class OptimizerApp(QMainWindow):
         self.run_button.setEnabled(False)
         control_layout.addWidget(self.run_button, 0, 1)
 
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self._cancel_optimization)
+        self.cancel_button.setEnabled(False)
+        control_layout.addWidget(self.cancel_button, 0, 2)
+
         self.status_label = QLabel("Ready to load 3D data.")
-        control_layout.addWidget(self.status_label, 1, 0, 1, 2)
+        control_layout.addWidget(self.status_label, 1, 0, 1, 3)
+
+        self.force_labels_cb = QCheckBox(f"Always Show Labels (> {MAX_NODE_LABELS} nodes)")
+        self.force_labels_cb.setChecked(self.force_node_labels)
+        self.force_labels_cb.toggled.connect(self._set_force_node_labels)
+        control_layout.addWidget(self.force_labels_cb, 2, 0, 1, 3)
+
+        # Optimizer settings: local SLSQP or global differential evolution, and how many processes
+        # evaluate trial designs in parallel (1 = in-process)
+        control_layout.addWidget(QLabel("Method:"), 3, 0)
+        self.method_combo = QComboBox()
+        self.method_combo.addItem("SLSQP (local)", 'SLSQP')
+        self.method_combo.addItem("Differential Evolution (global)", 'differential_evolution')
+        control_layout.addWidget(self.method_combo, 3, 1, 1, 2)
+
+        control_layout.addWidget(QLabel("Worker Processes:"), 4, 0)
+        self.workers_spin = QSpinBox()
+        self.workers_spin.setRange(1, os.cpu_count() or 1)
+        self.workers_spin.setValue(1)
+        control_layout.addWidget(self.workers_spin, 4, 1, 1, 2)
         
         left_layout.addWidget(control_frame)
         
         # Weight Controls UI
         self.weights_sliders = {}
+        self.weight_value_labels = {}
+        # Current weights in analysis.WEIGHT_KEYS order, kept in sync with the sliders by _apply_weights
+        self.weights_arr = np.zeros(len(WEIGHT_KEYS))
         weight_controls = self._create_weight_controls()
         left_layout.addWidget(weight_controls)
         
@@ -144,24 +242,42 @@ class OptimizerApp(QMainWindow):
             slider = QSlider(Qt.Horizontal)
             slider.setRange(0, 10000); slider.setValue(int(val*100))
             value_label = QLabel(f"{val:.2f}"); value_label.setFixedWidth(50)
-            slider.valueChanged.connect(lambda v, lbl=value_label: lbl.setText(f"{v/100:.2f}"))
+            slider.valueChanged.connect(lambda v, name=name: self._on_weight_changed(name, v))
             param_layout.addWidget(QLabel(name), row, 0)
             param_layout.addWidget(slider, row, 1)
             param_layout.addWidget(value_label, row, 2)
             self.weights_sliders[name] = slider
+            self.weight_value_labels[name] = value_label
+            self.weights_arr[WEIGHT_KEYS.index(WEIGHT_SLIDER_KEYS[name])] = val
         # layout.addWidget(param_group)
         return param_group
 
+    def _on_weight_changed(self, name, value):
+        """Records a slider tick and (re)starts the debounce timer."""
+        self._pending_weights[name] = value
+        self._weight_timer.start()
+
+    def _apply_weights(self):
+        """Applies the latest slider values once the slider has settled."""
+        for name, value in self._pending_weights.items():
+            self.weight_value_labels[name].setText(f"{value/100:.2f}")
+            self.weights_arr[WEIGHT_KEYS.index(WEIGHT_SLIDER_KEYS[name])] = value / 100.0
+        self._pending_weights.clear()
+
     def _create_input_tab(self):
         widget = QWidget()
         layout = QVBoxLayout(widget)
         
         # Points Table (now includes Z)
         layout.addWidget(QLabel("Node Coordinates (x, y, z)"))
-        self.points_table = QTableWidget()
-        self.points_table.setColumnCount(4)
-        self.points_table.setHorizontalHeaderLabels(['Node', 'x', 'y', 'z'])
+        # Model/view table: cells are formatted on demand from the coordinate arrays
+        self.points_model = ArrayTableModel(self)
+        self.points_model.set_dataframe(pd.DataFrame(columns=['Node', 'x', 'y', 'z']))
+        self.points_table = QTableView()
+        self.points_table.setModel(self.points_model)
         self.points_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.points_table.setSelectionMode(QAbstractItemView.MultiSelection)
+        self.points_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         layout.addWidget(self.points_table)
         
         return widget
@@ -184,7 +300,9 @@ class OptimizerApp(QMainWindow):
         layout = QVBoxLayout(widget)
         
         layout.addWidget(QLabel("Element Stress and Force Results (3D)"))
-        self.stresses_table = QTableWidget()
+        self.stresses_model = ArrayTableModel(self)
+        self.stresses_table = QTableView()
+        self.stresses_table.setModel(self.stresses_model)
         self.stresses_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         layout.addWidget(self.stresses_table)
         
@@ -197,17 +315,7 @@ class OptimizerApp(QMainWindow):
         
     def _update_points_table(self, df):
         """Populates the points table with 3D coordinates."""
-        self.points_table.setRowCount(len(df))
-        self.points_table.setColumnCount(4)
-        self.points_table.setHorizontalHeaderLabels(['Node', 'x', 'y', 'z'])
-        self.points_table.setSelectionMode(QAbstractItemView.MultiSelection)
-        self.points_table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        
-        for i, row in df.iterrows():
-            self.points_table.setItem(i, 0, QTableWidgetItem(str(row['Node'])))
-            self.points_table.setItem(i, 1, QTableWidgetItem(f"{row['x']:.2f}"))
-            self.points_table.setItem(i, 2, QTableWidgetItem(f"{row['y']:.2f}"))
-            self.points_table.setItem(i, 3, QTableWidgetItem(f"{row['z']:.2f}"))
+        self.points_model.set_dataframe(df[['Node', 'x', 'y', 'z']], formats=['', '.2f', '.2f', '.2f'])
 
     def _update_metrics_table(self, metrics):
         """Populates the metrics table."""
@@ -224,153 +332,157 @@ class OptimizerApp(QMainWindow):
         
         # Check if the dataframe is empty (e.g., if analysis failed)
         if df.empty:
-            self.stresses_table.setRowCount(1)
-            self.stresses_table.setColumnCount(1)
-            self.stresses_table.setHorizontalHeaderLabels(['Status'])
-            self.stresses_table.setItem(0, 0, QTableWidgetItem("3D Analysis failed or no data available."))
+            self.stresses_model.set_dataframe(pd.DataFrame({'Status': ["3D Analysis failed or no data available."]}))
             return
             
         # Ensure all required columns are present before proceeding
         required_cols = ['element', 'L', 'axial_force', 'axial_stress', 'Pc']
         if not all(col in df.columns for col in required_cols):
-            self.stresses_table.setRowCount(1)
-            self.stresses_table.setColumnCount(1)
-            self.stresses_table.setHorizontalHeaderLabels(['Error'])
-            self.stresses_table.setItem(0, 0, QTableWidgetItem("Analysis results are missing required columns."))
+            self.stresses_model.set_dataframe(pd.DataFrame({'Error': ["Analysis results are missing required columns."]}))
             return
 
-        self.stresses_table.setRowCount(len(df))
-        
-        # Select columns to display
+        # Select columns to display; numeric results are shown to 2 decimals
         display_cols = required_cols
-        self.stresses_table.setColumnCount(len(display_cols))
-        self.stresses_table.setHorizontalHeaderLabels(display_cols)
-        
-        for i, row in df.iterrows():
-            for j, col in enumerate(display_cols):
-                value = row[col]
-                # Format specific columns
-                if col in ['L', 'axial_force', 'axial_stress', 'Pc']:
-                    item = QTableWidgetItem(f"{value:.2f}" if pd.notna(value) else 'N/A')
-                else:
-                    item = QTableWidgetItem(str(value))
-                self.stresses_table.setItem(i, j, item)
+        formats = ['.2f' if col in ['L', 'axial_force', 'axial_stress', 'Pc'] else '' for col in display_cols]
+        self.stresses_model.set_dataframe(df[display_cols], formats=formats)
                 
+    def _set_force_node_labels(self, checked):
+        self.force_node_labels = checked
+        if self.model is not None:
+            self._mark_dirty('plot')
+            self._flush_ui()
+
+    def _setup_static_axes(self):
+        """Clears the axes and sets up the parts of the plot that don't depend on the truss."""
+        self.canvas.axes.cla()
+        self._node_labels = {}
+        self.canvas.axes.set_xlabel('X Axis')
+        self.canvas.axes.set_ylabel('Y Axis')
+        self.canvas.axes.set_zlabel('Z Axis')
+        self.canvas.axes.set_title("3D Truss Structure and Displacements (Scroll to Zoom)")
+        self._static_axes_ready = True
+
+    def _clear_truss_artists(self):
+        """Removes the members and nodes from the previous draw, keeping the axes and the node labels."""
+        ax = self.canvas.axes
+        for artist in list(ax.collections) + list(ax.lines):
+            artist.remove()
+
+    def _update_node_labels(self, label_df):
+        """Shows a label at each node of label_df, moving existing label artists and removing unused ones."""
+        labels = {}
+        for node, x, y, z in label_df[['Node', 'x', 'y', 'z']].itertuples(index=False):
+            text = self._node_labels.pop(node, None)
+            if text is None:
+                text = self.canvas.axes.text(x, y, z, str(node), color='black', fontsize=9, zdir='x')
+            else:
+                text.set_position_3d((x, y, z))
+            labels[node] = text
+        for text in self._node_labels.values():
+            text.remove()
+        self._node_labels = labels
+
     def _draw_truss(self, scale_factor=200):
         """Draws the 3D truss structure, forces, and displacements."""
-        self.canvas.axes.cla() # Clear the previous plot
-
         points_df = self.model.points
         trusses_df = self.model.trusses
         stresses_df = self.model.stresses_df
         
         if points_df.empty:
+            self.canvas.axes.cla() # Clear the previous plot
+            self._node_labels = {}
+            self._static_axes_ready = False
             self.canvas.axes.set_title("3D Truss Plot (No data loaded)")
             self.canvas.draw()
             return
+
+        # Rebuilding the axes (cla) is costly in 3D, so after the first draw only the truss artists are replaced
+        if self._static_axes_ready:
+            self._clear_truss_artists()
+        else:
+            self._setup_static_axes()
             
         # Check if stress data is valid for coloring (Fixes KeyError: 'element')
         is_stress_data_valid = 'element' in stresses_df.columns and not stresses_df.empty
             
-        # Get current coordinates
-        coords = points_df.set_index('Node')[['x', 'y', 'z']]
-        X, Y, Z = coords['x'].values, coords['y'].values, coords['z'].values
+        # Get current coordinates as one (n_nodes, 3) array
+        P = points_df[['x', 'y', 'z']].to_numpy(dtype=float)
+        X, Y, Z = P.T
         
+        # Row of each member's start/end node, resolved by the model when the design was loaded
+        i1, i2 = self.model.element_rows
+
         # --- 1. Draw Members (Trusses) ---
-        for _, row in trusses_df.iterrows():
-            p1 = coords.loc[row['start']].values
-            p2 = coords.loc[row['end']].values
-            
-            # Line data for the 3D plot
-            x_vals = [p1[0], p2[0]]
-            y_vals = [p1[1], p2[1]]
-            z_vals = [p1[2], p2[2]]
-            
-            # Determine color based on stress
-            color = 'gray'
-            if is_stress_data_valid:
-                # This line is now safe because we checked if the 'element' column exists
-                stress_row = stresses_df[stresses_df['element'] == row['element']]
-                if not stress_row.empty:
-                    stress = stress_row.iloc[0]['axial_stress']
-                    if pd.notna(stress):
-                        # Blue for compression (negative), Red for tension (positive)
-                        if stress < 0:
-                            color = '#007BFF' # Bright Blue for Compression
-                        elif stress > 0:
-                            color = '#DC3545' # Bright Red for Tension
-                        
-            self.canvas.axes.plot(x_vals, y_vals, z_vals, color=color, linewidth=2, marker='')
+        P1 = P[i1]
+        P2 = P[i2]
+
+        # Determine colors based on stress, aligned with trusses_df (NaN where no result)
+        if is_stress_data_valid:
+            stress_arr = stresses_df.set_index('element')['axial_stress'].reindex(trusses_df['element']).to_numpy()
+        else:
+            stress_arr = np.full(len(trusses_df), np.nan)
+        # Blue for compression (negative), Red for tension (positive), gray otherwise
+        colors = np.where(stress_arr < 0, '#007BFF', np.where(stress_arr > 0, '#DC3545', 'gray'))
+
+        # One collection for all members instead of one Line3D artist per member
+        member_lines = Line3DCollection(np.stack([P1, P2], axis=1), colors=colors, linewidths=2)
+        self.canvas.axes.add_collection3d(member_lines)
 
         # --- 2. Draw Nodes (Points) ---
         self.canvas.axes.scatter(X, Y, Z, c='k', marker='o', s=50, label='Nodes')
         
         # Annotate nodes
-        for i, row in points_df.iterrows():
-            self.canvas.axes.text(row['x'], row['y'], row['z'], str(row['Node']), color='black', fontsize=9, zdir='x')
+        label_df = points_df
+        if len(points_df) > MAX_NODE_LABELS and not self.force_node_labels:
+            # Large structure: keep labels for the nodes of interest only
+            key_nodes = set(self.model.supports['Node'])
+            if not self.model.loads.empty:
+                key_nodes.update(self.model.loads['Node'].dropna())
+            label_df = points_df[points_df['Node'].isin(key_nodes)]
+        self._update_node_labels(label_df)
 
         # --- 3. Draw Displaced Shape (if analyzed) ---
         # Only proceed if analysis was successful AND displacements are non-zero
-        max_disp = np.max(np.abs(self.model.displacements)) if self.model.displacements.size > 0 else 0
+        # U contains [u1x, u1y, u1z, u2x, ...] for nodes in the same order as points_df; view it as (n_nodes, 3)
+        U = self.model.displacements.reshape(-1, 3)
+        max_disp = np.abs(U).max() if U.size > 0 else 0
         if self.model.is_analyzed and max_disp > 1e-9:
-            U = self.model.displacements
-            
             # Dynamic scale factor calculation for visualization purposes
-            max_coord = np.max(np.abs(coords.values))
+            max_coord = np.abs(P).max()
             
             # Calculate a scale factor to make max displacement visually noticeable (e.g., 5% of max structure size)
             u_scale = (0.05 * max_coord) / max_disp if max_disp > 1e-9 else 1.0 
             u_scale = max(1.0, u_scale) # Ensure factor is at least 1
 
-            # Calculate displaced coordinates
-            # Correcting the index slicing for X, Y, Z coordinates and U vector 
-            # (Assuming U contains [u1x, u1y, u1z, u2x, u2y, u2z, ...] for nodes in the same order as points_df)
-            X_displaced = X + U[::3] * u_scale
-            Y_displaced = Y + U[1::3] * u_scale
-            Z_displaced = Z + U[2::3] * u_scale
-
-            # Draw displaced members
-            for i, row in trusses_df.iterrows():
-                i1_idx = points_df[points_df['Node'] == row['start']].index[0]
-                i2_idx = points_df[points_df['Node'] == row['end']].index[0]
+            # Calculate displaced coordinates in one vectorized add
+            P_displaced = P + U * u_scale
 
-                p1_disp = np.array([X_displaced[i1_idx], Y_displaced[i1_idx], Z_displaced[i1_idx]])
-                p2_disp = np.array([X_displaced[i2_idx], Y_displaced[i2_idx], Z_displaced[i2_idx]])
-
-                self.canvas.axes.plot(
-                    [p1_disp[0], p2_disp[0]], 
-                    [p1_disp[1], p2_disp[1]], 
-                    [p1_disp[2], p2_disp[2]], 
-                    '--', color='#FFC107', linewidth=1, marker=''
-                )
+            # Draw displaced members as a single dashed collection
+            displaced_segments = np.stack([P_displaced[i1], P_displaced[i2]], axis=1)
+            displaced_lines = Line3DCollection(displaced_segments, colors='#FFC107', linewidths=1, linestyles='dashed')
+            self.canvas.axes.add_collection3d(displaced_lines)
 
             # Draw displaced nodes
-            self.canvas.axes.scatter(X_displaced, Y_displaced, Z_displaced, c='#FFC107', marker='o', s=30, label=f'Displaced (x{u_scale:.1f})')
+            self.canvas.axes.scatter(*P_displaced.T, c='#FFC107', marker='o', s=30, label=f'Displaced (x{u_scale:.1f})')
             self.status_label.setText(self.status_label.text() + f" | Max Disp: {max_disp:.4e} (Scale: x{u_scale:.1f})")
 
 
-        # --- 4. Set labels and aspect ratio (Plotting Fix) ---
-        self.canvas.axes.set_xlabel('X Axis')
-        self.canvas.axes.set_ylabel('Y Axis')
-        self.canvas.axes.set_zlabel('Z Axis')
-        self.canvas.axes.set_title("3D Truss Structure and Displacements (Scroll to Zoom)")
-        
+        # --- 4. Set aspect ratio (Plotting Fix); labels are set in _setup_static_axes ---
         # FIX: Ensure proper 3D aspect ratio and limits for visibility
-        if X.size > 0:
+        if P.size > 0:
+            # Per-axis bounds in one reduction each
+            lo, hi = P.min(axis=0), P.max(axis=0)
+            mid = (lo + hi) * 0.5
             # Determine the maximum extent across all 3 axes
-            max_range = np.array([X.max()-X.min(), Y.max()-Y.min(), Z.max()-Z.min()]).max() / 2.0
-            max_range = max(1.0, max_range) # Ensure non-zero range
-
-            mid_x = (X.max()+X.min()) * 0.5
-            mid_y = (Y.max()+Y.min()) * 0.5
-            mid_z = (Z.max()+Z.min()) * 0.5
+            max_range = max(1.0, (hi - lo).max() / 2.0) # Ensure non-zero range
 
             # Set equal limits centered around the midpoint for a correct 3D view
-            self.canvas.axes.set_xlim(mid_x - max_range, mid_x + max_range)
-            self.canvas.axes.set_ylim(mid_y - max_range, mid_y + max_range)
-            self.canvas.axes.set_zlim(mid_z - max_range, mid_z + max_range)
+            self.canvas.axes.set_xlim(mid[0] - max_range, mid[0] + max_range)
+            self.canvas.axes.set_ylim(mid[1] - max_range, mid[1] + max_range)
+            self.canvas.axes.set_zlim(mid[2] - max_range, mid[2] + max_range)
         
-        self.canvas.draw()
+        # Schedule the paint; several updates in one handler then result in a single redraw
+        self.canvas.draw_idle()
         
     # --- Weight Handling Methods ---
     def _get_default_weights(self, as_init=False):
@@ -389,15 +501,11 @@ class OptimizerApp(QMainWindow):
         if as_init:
             return default_weights
             
-        # Read from UI inputs
-        weights = {}
-        return {
-            'buckling_distribution_factor': self.weights_sliders['Buckling Distribution Factor'].value() / 100.0,
-            'buckling_penalty': self.weights_sliders['Buckling Penalty'].value() / 100.0,
-            'material_usage': self.weights_sliders['Material Usage'].value() / 100.0,
-            'compressive_uniformity': self.weights_sliders['Compression Uniformity'].value() / 100.0,
-            'average_force_magnitude': self.weights_sliders['Average Force Magnitude'].value() / 100.0,
-        }
+        # Read from UI inputs (flushing a slider change still waiting on the debounce timer)
+        if self._weight_timer.isActive():
+            self._weight_timer.stop()
+            self._apply_weights()
+        return dict(zip(WEIGHT_KEYS, self.weights_arr))
         # for key, line_edit in self.weight_inputs.items():
         #     try:
         #         # Read the text and convert to float
@@ -421,17 +529,18 @@ class OptimizerApp(QMainWindow):
                 # 1. Update status and run initial analysis
                 self.status_label.setText(f"3D Truss data loaded from: {os.path.basename(directory)}")
                 self.run_button.setEnabled(True)
-                self.model.run_analysis()
+                # load_from_directory already analyzed the design; only rerun if it didn't
+                if not self.model.is_analyzed:
+                    self.model.run_analysis()
                 
                 # 2. Check if the analysis produced valid results
                 is_analysis_successful = self.model.is_analyzed and 'element' in self.model.stresses_df.columns
                 
-                self._update_points_table(self.model.points)
-                self._draw_truss() # Draw the structure regardless of analysis success
+                # Draw the structure regardless of analysis success; the stresses table shows the failure message
+                self._mark_dirty('points', 'plot', 'stresses')
 
                 if is_analysis_successful:
                     self.status_label.setText(self.status_label.text() + " | Analysis successful.")
-                    self._update_stresses_table(self.model.stresses_df)
                     
                     # Calculate initial objective for metrics table using current weights
                     initial_score, initial_metrics = get_objective(self.model, self._get_default_weights())
@@ -439,23 +548,43 @@ class OptimizerApp(QMainWindow):
                 else:
                     # Analysis failed (as indicated by your error message)
                     self.status_label.setText(self.status_label.text() + " | **3D Truss Analysis FAILED.** See console for details.")
-                    self._update_stresses_table(pd.DataFrame()) # Show error message in the stresses table
                     self._update_metrics_table({'Total Score': 'N/A', 'Status': 'Analysis Failed'})
                     self.run_button.setEnabled(False) # Optimization relies on a successful analysis
+
+                self._flush_ui()
                 
             else:
                 self.status_label.setText("Failed to load data. Check console for errors.")
                 self.run_button.setEnabled(False)
 
+    def _mark_dirty(self, *panels):
+        """Flags panels ('points', 'stresses', 'plot') for refresh by the next _flush_ui call."""
+        self._dirty.update(panels)
+
+    def _flush_ui(self):
+        """Refreshes each dirty panel exactly once."""
+        if 'points' in self._dirty:
+            self._update_points_table(self.model.points)
+        if 'stresses' in self._dirty:
+            self._update_stresses_table(self.model.stresses_df)
+        if 'plot' in self._dirty:
+            self._draw_truss()
+        self._dirty.clear()
+
     def _run_optimization(self):
         """Executes the 3D optimization process."""
         if self.model is None or self.model.points.empty:
             QMessageBox.warning(self, "Error", "No 3D truss data loaded.")
             return
 
+        selected_rows = self.points_table.selectionModel().selectedRows()
+        if not selected_rows:
+            QMessageBox.warning(self, "Warning", "Please select at least one node to optimize.")
+            return
+
         self.run_button.setEnabled(False)
+        self.load_button.setEnabled(False)
         self.status_label.setText("Running 3D optimization... Please wait.")
-        QApplication.processEvents() # Update GUI
         
         # Get weights from UI before starting optimization
         weights = self._get_default_weights() 
@@ -476,35 +605,83 @@ class OptimizerApp(QMainWindow):
         #      self.status_label.setText("No free nodes to optimize. Optimization aborted.")
         #      self.run_button.setEnabled(True)
         #      return
-        selected_rows = self.points_table.selectionModel().selectedRows()
-        nodes_to_optimize = [int(self.points_table.item(row.row(), 0).text().split(sep='.')[0]) for row in selected_rows]
+        nodes_to_optimize = [int(self.points_model.value(row.row(), 0)) for row in selected_rows]
         
         # NOTE: The current optimizer is designed for 2D. You may need to adapt 
         # optimizer.py's update_node_positions call to include the Z dimension 
         # if you want true 3D optimization. For now, it might only optimize X/Y.
 
-        optimized_model, final_score, final_metrics = optimize_truss(
-            self.model, nodes_to_optimize, weights
-        )
+        # Run the optimizer in a worker thread so the GUI stays responsive
+        self.optimizer_thread = QThread(self)
+        self.optimizer_worker = OptimizerWorker(self.model, nodes_to_optimize, weights,
+                                                method=self.method_combo.currentData(),
+                                                workers=self.workers_spin.value())
+        self.optimizer_worker.moveToThread(self.optimizer_thread)
+
+        self.optimizer_thread.started.connect(self.optimizer_worker.run)
+        self.optimizer_worker.progress.connect(self._on_optimization_progress)
+        self.optimizer_worker.finished.connect(self._on_optimization_finished)
+        self.optimizer_worker.failed.connect(self._on_optimization_failed)
+        self.optimizer_worker.finished.connect(self.optimizer_thread.quit)
+        self.optimizer_worker.failed.connect(self.optimizer_thread.quit)
+        self.optimizer_thread.finished.connect(self._on_optimization_thread_finished)
+
+        self.optimizer_thread.start()
+        self.cancel_button.setEnabled(True)
+
+    def _cancel_optimization(self):
+        """Stops the running optimization; its last iterate is only kept if it scores better than the current design."""
+        if self.optimizer_worker is not None:
+            self.optimizer_worker.cancel()
+            self.cancel_button.setEnabled(False)
+            self.status_label.setText("Cancelling 3D optimization...")
+
+    def _on_optimization_progress(self, iteration):
+        self.status_label.setText(f"Running 3D optimization... Iteration {iteration}")
+
+    def _on_optimization_failed(self, message):
+        self.status_label.setText(f"Optimization failed: {message}")
+        QMessageBox.warning(self, "Optimization Error", message)
+
+    def _on_optimization_thread_finished(self):
+        self.optimizer_worker.deleteLater()
+        self.optimizer_thread.deleteLater()
+        self.optimizer_worker = None
+        self.optimizer_thread = None
+        self.run_button.setEnabled(True)
+        self.load_button.setEnabled(True)
+        self.cancel_button.setEnabled(False)
+
+    def _on_optimization_finished(self, optimized_model, final_score, final_metrics, cancelled):
+        """Receives the worker's result on the GUI thread and refreshes the views."""
+        if optimized_model is None:
+            self.status_label.setText("Optimization cancelled. The current design was kept.")
+            return
         self.model = optimized_model
 
         # Save the optimized points to the output directory
         output_file = os.path.join(self.output_dir, f"optimized_points_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
         self.model.points.to_csv(output_file, index=False)
         
-        self.status_label.setText(f"Optimization complete! Final Score: {final_score:.4f}")
+        if cancelled:
+            self.status_label.setText(f"Optimization cancelled. Kept the improved design, Score: {final_score:.4f}")
+        else:
+            self.status_label.setText(f"Optimization complete! Final Score: {final_score:.4f}")
         self._update_metrics_table(final_metrics)
-        self._update_points_table(self.model.points)
-        self._update_stresses_table(self.model.stresses_df)
-        self._draw_truss()
-        
-        self.run_button.setEnabled(True)
+        self._mark_dirty('points', 'stresses', 'plot')
+        self._flush_ui()
 
     def closeEvent(self, event):
         """
         Overrides the default close behavior to ensure the object is
         deleted when closed, which triggers the QObject.destroyed signal.
         """
+        # Stop a running optimization before the window (and its thread) goes away
+        if self.optimizer_thread is not None:
+            self.optimizer_worker.cancel()
+            self.optimizer_thread.quit()
+            self.optimizer_thread.wait()
+
         # This is the line that makes the difference
         self.deleteLater()
         
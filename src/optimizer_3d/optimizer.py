@@ -1,19 +1,97 @@
 # optimizer.py
 
+import os
+from functools import partial
 import numpy as np
-from scipy.optimize import minimize
-from .analysis import get_objective
+from concurrent.futures import ProcessPoolExecutor
+from scipy.optimize import minimize, differential_evolution
+from .analysis import get_objective, weight_vector
 
-def optimize_truss(initial_model, nodes_to_optimize, weights, bounds=None, constraints=None):
+# differential_evolution population size multiplier (SciPy's default): each generation has
+# DE_POPSIZE * n_variables candidate designs
+DE_POPSIZE = 15
+
+class NodePositionObjective:
+    """
+    Picklable objective mapping a flat [x1, y1, z1, ...] vector to a score.
+    Accepts a single vector or a (N_params, M) stack of candidates, so it can be
+    used directly with differential_evolution(vectorized=True) and with worker pools.
+    """
+    def __init__(self, model, nodes_to_optimize, weights):
+        self.model = model
+        self.nodes_to_optimize = nodes_to_optimize
+        # Converted once; get_objective then indexes the array instead of the dict on every call
+        self.weights = weight_vector(weights)
+
+    def score(self, positions):
+        # Work on a copy to avoid modifying the model across iterations
+        temp_model = self.model.copy()
+        # The update_node_positions function now handles the [x1, y1, z1, ...] flat array
+        temp_model.update_node_positions(self.nodes_to_optimize, positions)
+
+        # The get_objective function will run the analysis internally
+        score, _ = get_objective(temp_model, self.weights)
+        return score
+
+    def __call__(self, positions):
+        positions = np.asarray(positions)
+        if positions.ndim == 2:
+            # Vectorized call: one candidate per column
+            return np.array([self.score(column) for column in positions.T])
+        return self.score(positions)
+
+# The objective in each pool worker process, installed once by _init_pool_worker
+_pool_objective = None
+
+def _init_pool_worker(objective):
+    """ProcessPoolExecutor initializer: receives the objective (and its model) once per worker."""
+    global _pool_objective
+    _pool_objective = objective
+
+class PooledObjective:
+    """
+    Stands in for a NodePositionObjective in the tasks SciPy sends to the pool: it pickles without
+    the objective, so each task carries little more than its position vector, and in a worker it
+    scores with the copy installed by _init_pool_worker.
+    """
+    def __init__(self, objective):
+        self.objective = objective
+
+    def __getstate__(self):
+        return {}
+
+    def __setstate__(self, state):
+        self.objective = None
+
+    def __call__(self, positions):
+        objective = self.objective if self.objective is not None else _pool_objective
+        return objective(positions)
+
+def _default_search_bounds(initial_model, initial_positions):
+    """Finite bounds for population-based search: the structure's bounding box, padded by 10%."""
+    coords = initial_model.points[['x', 'y', 'z']].values
+    lower, upper = coords.min(axis=0), coords.max(axis=0)
+    pad = 0.1 * max(np.max(upper - lower), 1.0)
+    lower, upper = lower - pad, upper + pad
+    n_nodes = len(initial_positions) // 3
+    return list(zip(np.tile(lower, n_nodes), np.tile(upper, n_nodes)))
+
+def optimize_truss(initial_model, nodes_to_optimize, weights, bounds=None, constraints=None,
+                   method='SLSQP', workers=1, callback=None):
     """
     Optimizes node positions of a truss model to minimize the objective score.
-    
+
     Args:
         initial_model (TrussModel): The initial, configured truss model.
         nodes_to_optimize (list): List of node IDs to move.
         weights (dict): A dictionary of weights for the objectives.
         bounds (list, optional): Bounds for the optimizer variables.
         constraints (list, optional): Constraints for the optimizer.
+        method (str, optional): 'SLSQP' (local, default) or 'differential_evolution' (global).
+        workers (int, optional): Worker processes used to evaluate trial points in parallel
+            (the population for differential_evolution, the finite-difference gradient for
+            SLSQP). 1 evaluates in-process; -1 uses all cores.
+        callback (callable, optional): Called by the optimizer after each iteration.
 
     Returns:
         A tuple of (optimized_model, final_score, final_metrics).
@@ -22,39 +100,72 @@ def optimize_truss(initial_model, nodes_to_optimize, weights, bounds=None, const
     initial_positions = initial_model.points.set_index('Node').loc[nodes_to_optimize, ['x', 'y', 'z']].values.flatten()
 
     # Objective function for the optimizer to minimize
-    def objective_func(positions):
-        # Work on a copy to avoid modifying the model across iterations
-        temp_model = initial_model.copy()
-        # The update_node_positions function now handles the [x1, y1, z1, ...] flat array
-        temp_model.update_node_positions(nodes_to_optimize, positions)
-        
-        # The get_objective function will run the analysis internally
-        score, _ = get_objective(temp_model, weights)
-        return score
-
-    # Default bounds if not provided
-    # Bounds must match the number of optimized variables (3 * number of nodes)
-    if bounds is None:
-        bounds = [(None, None)] * len(initial_positions)
+    objective_func = NodePositionObjective(initial_model, nodes_to_optimize, weights)
 
     # Default constraints if not provided
     if constraints is None:
         constraints = []
 
-    # Run the optimization using SciPy's minimizer
-    result = minimize(
-        objective_func,
-        initial_positions,
-        method='SLSQP',
-        bounds=bounds,
-        constraints=constraints,
-        options={'disp': True}
-    )
-    
+    # Trial points are independent, so they can be evaluated in a process pool. The model is sent to
+    # each worker once; tasks only carry position vectors, in one chunk per worker per batch
+    # (a differential_evolution generation, or the n points of a finite-difference gradient)
+    executor = None
+    trial_map = None
+    if workers != 1:
+        n_workers = (os.cpu_count() or 1) if workers == -1 else workers
+        executor = ProcessPoolExecutor(max_workers=n_workers, initializer=_init_pool_worker,
+                                       initargs=(objective_func,))
+        batch_size = len(initial_positions) * (DE_POPSIZE if method == 'differential_evolution' else 1)
+        trial_map = partial(executor.map, chunksize=max(1, -(-batch_size // n_workers)))
+        objective_func = PooledObjective(objective_func)
+
+    try:
+        if method == 'differential_evolution':
+            # Population-based search needs a finite box for every variable
+            if bounds is None:
+                bounds = _default_search_bounds(initial_model, initial_positions)
+            result = differential_evolution(
+                objective_func,
+                bounds,
+                x0=initial_positions,
+                popsize=DE_POPSIZE,
+                constraints=constraints or (),
+                # In-process, the whole population is scored in one vectorized call
+                vectorized=executor is None,
+                workers=trial_map or 1,
+                updating='deferred',
+                callback=callback,
+                polish=False,
+                disp=True
+            )
+        else:
+            # Default bounds if not provided
+            # Bounds must match the number of optimized variables (3 * number of nodes)
+            if bounds is None:
+                bounds = [(None, None)] * len(initial_positions)
+
+            options = {'disp': True}
+            if trial_map is not None:
+                options['workers'] = trial_map
+
+            # Run the optimization using SciPy's minimizer
+            result = minimize(
+                objective_func,
+                initial_positions,
+                method='SLSQP',
+                bounds=bounds,
+                constraints=constraints,
+                callback=callback,
+                options=options
+            )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
     # Create the final, optimized model
     final_model = initial_model.copy()
     final_model.update_node_positions(nodes_to_optimize, result.x)
-    
+
     final_score, final_metrics = get_objective(final_model, weights)
 
     return final_model, final_score, final_metrics
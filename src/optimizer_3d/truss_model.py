@@ -4,7 +4,29 @@ import os
 import pandas as pd
 import numpy as np
 from . import fem_solver
-import copy
+
+# Column types for the input CSVs, so pandas can skip type inference on load.
+# Ids use the nullable Int32 type so blank cells still load (they are cleaned up below);
+# columns missing from a file are simply ignored.
+POINT_DTYPES = {'Node': 'Int32', 'x': 'float64', 'y': 'float64', 'z': 'float64'}
+TRUSS_DTYPES = {'element': 'Int32', 'start': 'Int32', 'end': 'Int32', 'material_id': 'Int32'}
+SUPPORT_DTYPES = {'Node': 'Int32'}
+MATERIAL_DTYPES = {'E': 'float64', 'A': 'float64', 'I': 'float64'}
+LOAD_DTYPES = {'Node': 'Int32', 'Fx': 'float64', 'Fy': 'float64', 'Fz': 'float64'}
+
+def _read_csv(path, dtypes):
+    """Reads a CSV with the given column types, falling back to inference if a column doesn't parse."""
+    try:
+        return pd.read_csv(path, dtype=dtypes)
+    except (ValueError, TypeError):
+        return pd.read_csv(path)
+
+def _clean_ids(column):
+    """Integer id column with invalid/missing entries set to -1."""
+    if not pd.api.types.is_integer_dtype(column):
+        # Only needed when the typed read fell back to inference
+        column = pd.to_numeric(column, downcast='integer', errors='coerce')
+    return column.fillna(-1).astype(int)
 
 class TrussModel:
     """Encapsulates all data and operations for a truss design."""
@@ -22,8 +44,21 @@ class TrussModel:
         self.initial_lengths = pd.Series(dtype=float)
         self.initial_forces = pd.Series(dtype=float)
 
-        # Analysis Results
-        self.stresses_df = pd.DataFrame()
+        # Node ID -> row of `points`; node IDs and row order are fixed once loaded
+        self._node_to_row = {}
+        # Array mirrors of the geometry used by the solver (DataFrames are kept for I/O and the UI):
+        # node coordinates in `points` row order, and each member's start/end rows
+        self._xyz = np.empty((0, 3))
+        self._start_idx = np.empty(0, dtype=np.int32)
+        self._end_idx = np.empty(0, dtype=np.int32)
+
+        # Everything the solver needs except coordinates (fem_solver.build_topology); built on the first
+        # analysis, invariant during optimization and shared by copies
+        self.topology = None
+
+        # Analysis Results (see the stresses_df property for a DataFrame view)
+        self.results = fem_solver.StressResults.empty_results()
+        self._stresses_df = None
         self.displacements = np.array([])
         self.is_analyzed = False
 
@@ -36,14 +71,14 @@ class TrussModel:
             materials_path = os.path.join(directory_path, "materials.csv")
             loads_path = os.path.join(directory_path, "loads.csv")
             
-            self.points = pd.read_csv(points_path)
-            self.trusses = pd.read_csv(trusses_path)
-            self.supports = pd.read_csv(supports_path)
-            self.materials = pd.read_csv(materials_path)
+            self.points = _read_csv(points_path, POINT_DTYPES)
+            self.trusses = _read_csv(trusses_path, TRUSS_DTYPES)
+            self.supports = _read_csv(supports_path, SUPPORT_DTYPES)
+            self.materials = _read_csv(materials_path, MATERIAL_DTYPES)
             
             # Check for optional loads file
             if os.path.exists(loads_path):
-                self.loads = pd.read_csv(loads_path)
+                self.loads = _read_csv(loads_path, LOAD_DTYPES)
             else:
                 self.loads = pd.DataFrame()
 
@@ -60,15 +95,18 @@ class TrussModel:
                 self.points['z'] = 0.0
             
             # 3. Clean up and validate types
-            self.points['Node'] = pd.to_numeric(self.points['Node'], downcast='integer', errors='coerce').fillna(-1).astype(int)
-            self.supports['Node'] = pd.to_numeric(self.supports['Node'], downcast='integer', errors='coerce').fillna(-1).astype(int)
+            self.points['Node'] = _clean_ids(self.points['Node'])
+            self.supports['Node'] = _clean_ids(self.supports['Node'])
             
-            self.trusses['element'] = pd.to_numeric(self.trusses['element'], downcast='integer', errors='coerce').fillna(-1).astype(int)
-            self.trusses['start'] = pd.to_numeric(self.trusses['start'], downcast='integer', errors='coerce').fillna(-1).astype(int)
-            self.trusses['end'] = pd.to_numeric(self.trusses['end'], downcast='integer', errors='coerce').fillna(-1).astype(int)
-            self.trusses['material_id'] = pd.to_numeric(self.trusses['material_id'], downcast='integer', errors='coerce').fillna(-1).astype(int)
+            for col in ['element', 'start', 'end', 'material_id']:
+                self.trusses[col] = _clean_ids(self.trusses[col])
             
             # --- END Synchronization and Validation ---
+
+            self._node_to_row = dict(zip(self.points['Node'].values, np.arange(len(self.points))))
+            self._xyz = self.points[['x', 'y', 'z']].to_numpy(dtype=float, copy=True)
+            self._start_idx = np.fromiter((self._node_to_row[n] for n in self.trusses['start']), dtype=np.int32, count=len(self.trusses))
+            self._end_idx = np.fromiter((self._node_to_row[n] for n in self.trusses['end']), dtype=np.int32, count=len(self.trusses))
             
             # Store initial state (deep copy required)
             self.initial_points = self.points.copy()
@@ -77,8 +115,8 @@ class TrussModel:
 
             # Run an initial analysis to get baseline forces
             self.run_analysis()
-            if not self.stresses_df.empty:
-                self.initial_forces = self.stresses_df['axial_force'].copy()
+            if not self.results.empty:
+                self.initial_forces = pd.Series(self.results.axial_force)
             
         except Exception as e:
             # Re-raise non-pandas loading exceptions
@@ -86,53 +124,87 @@ class TrussModel:
                 raise
             
     def copy(self):
-        """Creates a deep copy of the TrussModel for use in optimization iterations."""
-        return copy.deepcopy(self)
+        """
+        Creates a copy of the TrussModel for use in optimization iterations.
+        Only the coordinate array is duplicated: the `points` frame is rebuilt rather than
+        modified when coordinates change, trusses, supports, materials, loads and the initial
+        state are never mutated after loading, and analysis results are replaced rather
+        than modified in place, so copies share them instead of cloning.
+        """
+        new_model = TrussModel.__new__(TrussModel)
+        new_model.__dict__.update(self.__dict__)
+        new_model._xyz = self._xyz.copy()
+        return new_model
+
+    @property
+    def points(self):
+        """Node table (Node, x, y, z); coordinates moved by update_node_positions are synced in on access."""
+        if self._points_stale:
+            # assign() returns a new frame, so copies still sharing the old one are unaffected
+            self._points = self._points.assign(x=self._xyz[:, 0], y=self._xyz[:, 1], z=self._xyz[:, 2])
+            self._points_stale = False
+        return self._points
+
+    @points.setter
+    def points(self, points_df):
+        self._points = points_df
+        self._points_stale = False
+
+    @property
+    def element_rows(self):
+        """(start_rows, end_rows): the `points` row of each member's start and end node."""
+        return self._start_idx, self._end_idx
 
     def _calculate_initial_lengths(self):
         """Calculate the original length of each truss member. Uses 3D coordinates."""
-        lengths = []
-        # CRITICAL FIX: Ensure 'z' is included for 3D length calculation
-        node_coords = self.initial_points.set_index('Node')[['x', 'y', 'z']] 
-        for _, row in self.trusses.iterrows():
-            p1 = node_coords.loc[row['start']].values
-            p2 = node_coords.loc[row['end']].values
-            # 3D distance calculation
-            lengths.append(np.linalg.norm(p2 - p1)) 
+        # 3D distance calculation, all members at once (the arrays still hold the loaded geometry)
+        lengths = np.linalg.norm(self._xyz[self._end_idx] - self._xyz[self._start_idx], axis=1)
         self.initial_lengths = pd.Series(lengths, index=self.trusses.index)
 
     def run_analysis(self):
         """Runs the FEM simulation on the current truss geometry."""
         try:
-            # fem_solver.truss_analyze now handles 3D and consistent indexing
-            self.stresses_df, self.displacements = fem_solver.truss_analyze(
-                self.points, self.trusses, self.supports, self.materials, self.loads
-            )
+            # Topology arrays are derived from the DataFrames once; after that each analysis
+            # only needs the current coordinates. `_points` supplies node IDs and their order,
+            # so the DataFrame doesn't need to be synced on every optimizer step
+            if self.topology is None:
+                self.topology = fem_solver.build_topology(
+                    self._points, self.trusses, self.supports, self.materials, self.loads
+                )
+            self.results, self.displacements = fem_solver.truss_analyze_fast(self._xyz, self.topology)
         except Exception as e:
             print(f"Truss solver failed: {e}")
-            self.stresses_df, self.displacements = pd.DataFrame(), np.array([])
+            self.results, self.displacements = fem_solver.StressResults.empty_results(), np.array([])
+        self._stresses_df = None
         self.is_analyzed = True
 
+    @property
+    def stresses_df(self):
+        """Analysis results as a DataFrame for display; built on first access after each analysis."""
+        if self._stresses_df is None:
+            self._stresses_df = self.results.to_dataframe()
+        return self._stresses_df
+
     def update_node_positions(self, nodes_to_optimize, new_positions_flat):
         """
         Updates the x, y, z coordinates for a given set of nodes. 
         Assumes new_positions_flat is a 1D array of [x1, y1, z1, x2, y2, z2, ...].
         """
         self.is_analyzed = False # Position changed, analysis is now stale
+        # One (x, y, z) row per node (3 DOF)
+        new_positions = np.asarray(new_positions_flat, dtype=float).reshape(-1, 3)
+
+        rows, positions = [], []
         for i, node_id in enumerate(nodes_to_optimize):
-            # Index positions for x, y, z in the flat array (3 DOF)
-            x_idx = 3 * i
-            y_idx = 3 * i + 1
-            z_idx = 3 * i + 2 # CRITICAL FIX: Ensure z is updated
-            
-            df_index = self.points[self.points['Node'] == node_id].index
-            if not df_index.empty:
-                idx = df_index[0]
-                
-                # Update x, y, z
-                self.points.loc[idx, 'x'] = new_positions_flat[x_idx]
-                self.points.loc[idx, 'y'] = new_positions_flat[y_idx]
-                self.points.loc[idx, 'z'] = new_positions_flat[z_idx]
-                
-            else:
+            row = self._node_to_row.get(node_id)
+            if row is None:
                 print(f"Warning: Node ID {node_id} not found in points DataFrame during position update.")
+                continue
+            rows.append(row)
+            positions.append(new_positions[i])
+
+        if rows:
+            # Scatter all updated coordinates in one bulk assignment instead of per-cell .loc writes;
+            # the `points` DataFrame picks them up when it is next read
+            self._xyz[rows] = positions
+            self._points_stale = True
@@ -1,4 +1,5 @@
 from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from mpl_toolkits.mplot3d import Axes3D # Required for 'projection='3d'
@@ -20,9 +21,45 @@ class Mpl3DCanvas(FigureCanvas):
         
         # Connect mouse scroll event for zooming
         self.fig.canvas.mpl_connect('scroll_event', self.on_scroll)
+        # Scroll steps are accumulated and applied once per frame (~16 ms), so a fast
+        # wheel or trackpad triggers one limit update and repaint instead of one per event
+        self._pending_zoom = 1.0
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.timeout.connect(self._apply_zoom)
+
+        # Text is the slowest artist to redraw, so labels are hidden while the view is being rotated
+        self._hidden_labels = []
+        self.fig.canvas.mpl_connect('button_press_event', self._on_rotate_start)
+        self.fig.canvas.mpl_connect('button_release_event', self._on_rotate_end)
+
+    def _on_rotate_start(self, event):
+        """Hides the axes' text labels when a mouse drag starts on the 3D axes."""
+        if event.inaxes is not self.axes:
+            return
+        self._hidden_labels = [text for text in self.axes.texts if text.get_visible()]
+        for text in self._hidden_labels:
+            text.set_visible(False)
+
+    def _on_rotate_end(self, event):
+        """Restores the labels hidden by _on_rotate_start."""
+        if not self._hidden_labels:
+            return
+        for text in self._hidden_labels:
+            text.set_visible(True)
+        self._hidden_labels = []
+        self.draw_idle()
 
     def on_scroll(self, event):
         """Handle mouse scroll event for zooming in/out in 3D."""
+        # Define the zoom factor (1.1 for zoom in, 1/1.1 for zoom out)
+        self._pending_zoom *= 1.1 if event.button == 'up' else 1/1.1
+        if not self._zoom_timer.isActive():
+            self._zoom_timer.start(16)
+
+    def _apply_zoom(self):
+        """Applies the zoom accumulated by on_scroll since the last frame."""
+        zoom_factor, self._pending_zoom = self._pending_zoom, 1.0
         ax = self.axes
         
         # Get current limits
@@ -39,9 +76,6 @@ class Mpl3DCanvas(FigureCanvas):
         range_x = xlim[1] - xlim[0]
         range_y = ylim[1] - ylim[0]
         range_z = zlim[1] - zlim[0]
-
-        # Define the zoom factor (1.1 for zoom in, 1/1.1 for zoom out)
-        zoom_factor = 1.1 if event.button == 'up' else 1/1.1 
         
         # Calculate new ranges
         new_range_x = range_x / zoom_factor
@@ -53,7 +87,7 @@ class Mpl3DCanvas(FigureCanvas):
         ax.set_ylim3d(center_y - new_range_y / 2, center_y + new_range_y / 2)
         ax.set_zlim3d(center_z - new_range_z / 2, center_z + new_range_z / 2)
         
-        self.draw()
+        self.draw_idle()
 
     def update_theme(self, theme_config):
         """
@@ -104,3 +138,65 @@ class Mpl3DCanvas(FigureCanvas):
         # it's usually best to call the main drawing function after changing the theme 
         # (which is already done in main_3d.py's _toggle_theme method).
 # Removed the unused MplCanvas class to simplify the file.
+
+class ArrayTableModel(QAbstractTableModel):
+    """
+    A read-only QAbstractTableModel over per-column NumPy arrays, for use with a QTableView.
+    Cells are formatted only when Qt asks for them, so no item objects are created per cell.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._headers = []
+        self._columns = []
+        self._formats = []
+
+    def set_dataframe(self, df, formats=None):
+        """
+        Replaces the table contents with the columns of df.
+        formats is an optional list of format specs per column (e.g. '.2f'); NaN shows as 'N/A'.
+        If the shape is unchanged the cells are updated in place, so views keep their selection
+        (the points table's selection picks the nodes to optimize); otherwise the model is reset.
+        """
+        headers = [str(col) for col in df.columns]
+        columns = [df[col].to_numpy() for col in df.columns]
+        formats = list(formats) if formats is not None else [''] * len(columns)
+        same_shape = (len(columns) == len(self._columns)
+                      and (len(columns[0]) if columns else 0) == self.rowCount())
+        if not same_shape:
+            self.beginResetModel()
+        self._headers, self._columns, self._formats = headers, columns, formats
+        if not same_shape:
+            self.endResetModel()
+            return
+
+        if self._columns and self.rowCount() > 0:
+            self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, len(self._columns) - 1))
+        if self._columns:
+            self.headerDataChanged.emit(Qt.Horizontal, 0, len(self._columns) - 1)
+
+    def value(self, row, column):
+        """Returns the raw (unformatted) value of a cell."""
+        return self._columns[column][row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return len(self._columns[0]) if self._columns else 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self._columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+
+        value = self._columns[index.column()][index.row()]
+        spec = self._formats[index.column()]
+        if not spec:
+            return str(value)
+        return format(value, spec) if not np.isnan(value) else 'N/A'
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section]
+        return str(section + 1)
@@ -1,5 +1,7 @@
 # ui_themes.py
 
+import re
+
 LIGHT_THEME = """
 QMainWindow, QWidget {
     background-color: #f7f7f7;
@@ -22,7 +24,7 @@ QPushButton {
 QPushButton:hover {
     background-color: #d0d0d0;
 }
-QLineEdit, QTableWidget {
+QLineEdit, QTableView {
     background-color: #ffffff;
     border: 1px solid #bfbfbf;
     border-radius: 4px;
@@ -63,7 +65,7 @@ QTabBar::tab:selected {
     background: #ffffff;
     border-bottom-color: #ffffff;
 }
-QTableWidget::item:selected { /* Enhanced selection visibility */
+QTableView::item:selected { /* Enhanced selection visibility */
     background-color: #c72125; /* Brighter background */
 }
 QSlider::groove:horizontal {
@@ -104,7 +106,7 @@ QPushButton {
 QPushButton:hover {
     background-color: #505354;
 }
-QLineEdit, QTableWidget {
+QLineEdit, QTableView {
     background-color: #2f2f2f;
     color: #f0f0f0;
     border: 1px solid #5b5b5b;
@@ -153,7 +155,7 @@ QSlider::groove:horizontal {
     border-radius: 3px;
 }
 }
-QTableWidget::item:selected { /* Enhanced selection visibility */
+QTableView::item:selected { /* Enhanced selection visibility */
     background-color: #c72125; /* Brighter background */
 }
 QSlider::handle:horizontal {
@@ -163,4 +165,14 @@ QSlider::handle:horizontal {
     margin: -5px 0;
     border-radius: 7px;
 }
-"""
\ No newline at end of file
+"""
+
+
+def _compact_stylesheet(qss):
+    """Strips comments and redundant whitespace so Qt has less to parse on each theme switch."""
+    qss = re.sub(r'/\*.*?\*/', '', qss, flags=re.S)
+    return re.sub(r'\s+', ' ', qss).strip()
+
+# Compacted once at import; the strings above stay readable for editing
+LIGHT_THEME = _compact_stylesheet(LIGHT_THEME)
+DARK_THEME = _compact_stylesheet(DARK_THEME)
@@ -1,15 +1,55 @@
 import sys
 import os
+from functools import lru_cache
 import numpy as np
 import pandas as pd
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                                QHBoxLayout, QLabel, QPushButton, QCheckBox,
                                QLineEdit, QFileDialog, QSlider, QGridLayout,
                                QMessageBox, QFrame, QSizePolicy, QGroupBox)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-import matplotlib.patches as patches
+from matplotlib.collections import LineCollection
+
+try:
+    import pyarrow  # noqa: F401 (only needed by pandas' pyarrow CSV engine)
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+# Columns the renderer reads from each input file; other columns are not parsed. Coordinates and
+# forces have fixed types, so pandas skips inferring them; ID columns are still inferred
+POINT_COLUMNS = ('Node', 'x', 'y')
+TRUSS_COLUMNS = ('element', 'start', 'end')
+SUPPORT_COLUMNS = ('Node', 'Rx', 'Ry')
+LOAD_COLUMNS = ('Node', 'Fx', 'Fy')
+COLUMN_DTYPES = {'x': 'float64', 'y': 'float64', 'Fx': 'float64', 'Fy': 'float64'}
+
+@lru_cache(maxsize=32)
+def _parse_csv(path, mtime_ns, size, columns=None):
+    """
+    Parsed CSV, cached per path, modification time and size so reselecting an unchanged design
+    skips parsing. Uses the multithreaded pyarrow parser when available, else pandas' C parser.
+    columns is an optional tuple of the columns to keep; ones missing from the file are ignored.
+    """
+    dtypes = {col: dtype for col, dtype in COLUMN_DTYPES.items() if columns is None or col in columns}
+    if CSV_ENGINE != 'c':
+        try:
+            df = pd.read_csv(path, engine=CSV_ENGINE, dtype=dtypes)
+            return df if columns is None else df[[col for col in df.columns if col in columns]]
+        except (ValueError, TypeError, ImportError):
+            pass  # pyarrow is stricter about malformed rows; the C parser decides
+    usecols = None if columns is None else (lambda col: col in columns)
+    try:
+        return pd.read_csv(path, usecols=usecols, dtype=dtypes)
+    except (ValueError, TypeError):
+        return pd.read_csv(path, usecols=usecols)  # a typed column didn't parse; infer it instead
+
+def _read_csv(path, columns=None):
+    """Reads a CSV file (optionally just the given columns); the result is a fresh copy the caller may modify."""
+    stat = os.stat(path)
+    return _parse_csv(path, stat.st_mtime_ns, stat.st_size, columns).copy()
 
 # --- ASSUMED EXTERNAL IMPORTS / PLACEHOLDER FUNCTIONS ---
 try:
@@ -22,14 +62,14 @@ except ImportError:
             if not os.path.exists(p):
                 raise FileNotFoundError(p)
         data = {}
-        points_df = pd.read_csv(points_path)
+        points_df = _read_csv(points_path, POINT_COLUMNS)
         if 'Node' in points_df.columns:
             points_df = points_df.set_index('Node', drop=False)
         data['points'] = points_df
-        data['trusses'] = pd.read_csv(trusses_path)
-        data['supports'] = pd.read_csv(supports_path)
-        data['materials'] = pd.read_csv(materials_path)
-        data['loads'] = pd.read_csv(loads_path) if loads_path and os.path.exists(loads_path) else None
+        data['trusses'] = _read_csv(trusses_path, TRUSS_COLUMNS)
+        data['supports'] = _read_csv(supports_path, SUPPORT_COLUMNS)
+        data['materials'] = _read_csv(materials_path)
+        data['loads'] = _read_csv(loads_path, LOAD_COLUMNS) if loads_path and os.path.exists(loads_path) else None
         return data
 
     def run_truss_simulation(data):
@@ -47,6 +87,13 @@ except ImportError:
         return trusses_df, None
 # --------------------------------------------------------
 
+# Parts of the plot show_truss can update on their own; a new data set always redraws all of them
+REFRESH_ALL = frozenset({'arrows', 'limits', 'labels', 'titles'})
+
+# Above this many members, members and nodes are rasterized (drawn as one image in vector
+# exports) and members skip antialiasing on screen
+LARGE_TRUSS_MEMBERS = 100
+
 
 class MplCanvas(FigureCanvas):
     """A custom class to embed a Matplotlib figure into a PyQt widget."""
@@ -58,6 +105,42 @@ class MplCanvas(FigureCanvas):
         self.setParent(parent)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 
+        # Blitting: artists marked animated are left out of full draws and painted over a cached
+        # copy of everything else, so they can be redrawn without re-rendering the rest of the figure
+        self.animated_artists = []
+        self._background = None
+        self.mpl_connect('draw_event', self._on_draw)
+
+    @property
+    def can_blit(self):
+        """True once a full draw has cached the background for the current animated artists."""
+        return self._background is not None
+
+    def set_animated_artists(self, artists):
+        """
+        Registers the artists to keep out of the background. They are marked animated before they are
+        first drawn, so the cached background never contains them and stays valid when they are replaced.
+        """
+        # Painted in zorder, as a full draw would
+        self.animated_artists = sorted(artists, key=lambda artist: artist.get_zorder())
+        for artist in self.animated_artists:
+            artist.set_animated(True)
+
+    def blit_animated(self):
+        """Repaints just the animated artists over the cached background."""
+        self.restore_region(self._background)
+        self._draw_animated()
+        self.blit(self.fig.bbox)
+
+    def _on_draw(self, event):
+        """After a full draw (including resizes), caches the background and paints the animated artists on it."""
+        self._background = self.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        for artist in self.animated_artists:
+            self.fig.draw_artist(artist)
+
 
 class TrussRenderer(QMainWindow):
     """Standalone application for rendering and exporting a truss design."""
@@ -70,6 +153,29 @@ class TrussRenderer(QMainWindow):
         self.current_data_dir = ""
         self.auto_xlim = (0, 1)
         self.auto_ylim = (0, 1)
+        # Parsed axis limit fields (x min, x max, y min, y max), None where blank; see _on_limits_edited
+        self._user_limits = (None,) * 4
+        # Per-design drawing invariants, rebuilt by _cache_geometry when a design is loaded
+        self._geometry_points = None
+        self._xy = np.empty((0, 2))
+        self._idx_map = pd.Series(dtype=int)
+        self._label_ids = np.empty(0)
+        self._max_span = 0.0
+        # Artists of the current figure that redraws update in place (see _build_truss_artists)
+        self._artists = {}
+        # What the last tight_layout call was made for (see show_truss); None forces a new layout
+        self._layout_key = None
+        # Figure size (inches) last set for the aspect mode (see _resize_figure)
+        self._figure_size = None
+
+        # Slider drags and typing emit a burst of change signals; refresh_plot restarts this
+        # single-shot timer so a burst costs one redraw, ~30 ms after the last change
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(30)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        # Parts requested since the last redraw (see REFRESH_ALL)
+        self._pending_parts = set()
 
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
@@ -111,27 +217,27 @@ class TrussRenderer(QMainWindow):
         axis_layout = QGridLayout(axis_group)
         self.square_aspect_cb = QCheckBox("Force Square Aspect Ratio")
         self.square_aspect_cb.setChecked(True)
-        self.square_aspect_cb.stateChanged.connect(self.refresh_plot)
+        self.square_aspect_cb.stateChanged.connect(lambda: self.refresh_plot({'limits'}))
         axis_layout.addWidget(self.square_aspect_cb, 0, 0, 1, 4)
         axis_layout.addWidget(QLabel("X Min:"), 1, 0)
         self.xmin_edit = QLineEdit()
         self.xmin_edit.setToolTip("Leave blank for auto-limit.")
-        self.xmin_edit.editingFinished.connect(self.refresh_plot)
+        self.xmin_edit.editingFinished.connect(self._on_limits_edited)
         axis_layout.addWidget(self.xmin_edit, 1, 1)
         axis_layout.addWidget(QLabel("X Max:"), 1, 2)
         self.xmax_edit = QLineEdit()
         self.xmax_edit.setToolTip("Leave blank for auto-limit.")
-        self.xmax_edit.editingFinished.connect(self.refresh_plot)
+        self.xmax_edit.editingFinished.connect(self._on_limits_edited)
         axis_layout.addWidget(self.xmax_edit, 1, 3)
         axis_layout.addWidget(QLabel("Y Min:"), 2, 0)
         self.ymin_edit = QLineEdit()
         self.ymin_edit.setToolTip("Leave blank for auto-limit.")
-        self.ymin_edit.editingFinished.connect(self.refresh_plot)
+        self.ymin_edit.editingFinished.connect(self._on_limits_edited)
         axis_layout.addWidget(self.ymin_edit, 2, 1)
         axis_layout.addWidget(QLabel("Y Max:"), 2, 2)
         self.ymax_edit = QLineEdit()
         self.ymax_edit.setToolTip("Leave blank for auto-limit.")
-        self.ymax_edit.editingFinished.connect(self.refresh_plot)
+        self.ymax_edit.editingFinished.connect(self._on_limits_edited)
         axis_layout.addWidget(self.ymax_edit, 2, 3)
         reset_limits_btn = QPushButton("Reset to Auto Limits")
         reset_limits_btn.clicked.connect(self.reset_axis_limits)
@@ -143,23 +249,22 @@ class TrussRenderer(QMainWindow):
         label_layout = QGridLayout(label_group)
         label_layout.addWidget(QLabel("Plot Title:"), 0, 0)
         self.title_edit = QLineEdit()
-        self.title_edit.editingFinished.connect(self.refresh_plot)
+        self.title_edit.editingFinished.connect(lambda: self.refresh_plot({'titles'}))
         label_layout.addWidget(self.title_edit, 0, 1, 1, 2)
         label_layout.addWidget(QLabel("X-Axis Label:"), 1, 0)
         self.xlabel_edit = QLineEdit("X-coordinate (m)")
-        self.xlabel_edit.editingFinished.connect(self.refresh_plot)
+        self.xlabel_edit.editingFinished.connect(lambda: self.refresh_plot({'titles'}))
         label_layout.addWidget(self.xlabel_edit, 1, 1, 1, 2)
         label_layout.addWidget(QLabel("Y-Axis Label:"), 2, 0)
         self.ylabel_edit = QLineEdit("Y-coordinate (m)")
-        self.ylabel_edit.editingFinished.connect(self.refresh_plot)
+        self.ylabel_edit.editingFinished.connect(lambda: self.refresh_plot({'titles'}))
         label_layout.addWidget(self.ylabel_edit, 2, 1, 1, 2)
         label_layout.addWidget(QLabel("Axis/Title Size:"), 3, 0)
         self.axis_text_size_slider = QSlider(Qt.Orientation.Horizontal)
         self.axis_text_size_slider.setRange(8, 20)
         self.axis_text_size_slider.setValue(12)
-        self.axis_text_size_slider.valueChanged.connect(self.refresh_plot)
+        self.axis_text_size_slider.valueChanged.connect(lambda: self.refresh_plot({'titles'}))
         self.axis_text_size_label = QLabel(f"{self.axis_text_size_slider.value()} pts")
-        self.axis_text_size_slider.valueChanged.connect(lambda v, vl=self.axis_text_size_label: vl.setText(f"{v} pts"))
         label_layout.addWidget(self.axis_text_size_slider, 4, 0, 1, 2)
         label_layout.addWidget(self.axis_text_size_label, 4, 2)
         control_layout.addWidget(label_group)
@@ -170,37 +275,34 @@ class TrussRenderer(QMainWindow):
         config_layout = QGridLayout(config_group)
         self.show_nodes_cb = QCheckBox("Show Node IDs")
         self.show_nodes_cb.setChecked(True)
-        self.show_nodes_cb.stateChanged.connect(self.refresh_plot)
+        self.show_nodes_cb.stateChanged.connect(lambda: self.refresh_plot({'labels'}))
         config_layout.addWidget(self.show_nodes_cb, 1, 0, 1, 3)
         self.show_trusses_cb = QCheckBox("Show Element IDs")
         self.show_trusses_cb.setChecked(False)
-        self.show_trusses_cb.stateChanged.connect(self.refresh_plot)
+        self.show_trusses_cb.stateChanged.connect(lambda: self.refresh_plot({'labels'}))
         config_layout.addWidget(self.show_trusses_cb, 2, 0, 1, 3)
         config_layout.addWidget(QLabel("Force Arrow Scale:"), 3, 0)
         self.scale_slider = QSlider(Qt.Orientation.Horizontal)
         self.scale_slider.setRange(1, 20)
         self.scale_slider.setValue(10)
-        self.scale_slider.valueChanged.connect(self.refresh_plot)
+        self.scale_slider.valueChanged.connect(lambda: self.refresh_plot({'arrows'}))
         self.scale_label = QLabel(f"{self.scale_slider.value()/100:.2f}")
-        self.scale_slider.valueChanged.connect(lambda v, vl=self.scale_label: vl.setText(f"{v/100:.2f}"))
         config_layout.addWidget(self.scale_slider, 4, 0, 1, 2)
         config_layout.addWidget(self.scale_label, 4, 2)
         config_layout.addWidget(QLabel("Node/Elem. Size:"), 5, 0)
         self.text_size_slider = QSlider(Qt.Orientation.Horizontal)
         self.text_size_slider.setRange(5, 15)
         self.text_size_slider.setValue(9)
-        self.text_size_slider.valueChanged.connect(self.refresh_plot)
+        self.text_size_slider.valueChanged.connect(lambda: self.refresh_plot({'labels'}))
         self.text_size_label = QLabel(f"{self.text_size_slider.value()} pts")
-        self.text_size_slider.valueChanged.connect(lambda v, vl=self.text_size_label: vl.setText(f"{v} pts"))
         config_layout.addWidget(self.text_size_slider, 6, 0, 1, 2)
         config_layout.addWidget(self.text_size_label, 6, 2)
         config_layout.addWidget(QLabel("Padding/Zoom:"), 7, 0)
         self.zoom_slider = QSlider(Qt.Orientation.Horizontal)
         self.zoom_slider.setRange(5, 50)
         self.zoom_slider.setValue(20)
-        self.zoom_slider.valueChanged.connect(self.refresh_plot)
+        self.zoom_slider.valueChanged.connect(lambda: self.refresh_plot({'limits'}))
         self.zoom_label = QLabel(f"{self.zoom_slider.value()}% pad")
-        self.zoom_slider.valueChanged.connect(lambda v, vl=self.zoom_label: vl.setText(f"{v}% pad"))
         config_layout.addWidget(self.zoom_slider, 8, 0, 1, 2)
         config_layout.addWidget(self.zoom_label, 8, 2)
         control_layout.addWidget(config_group)
@@ -232,32 +334,49 @@ class TrussRenderer(QMainWindow):
         legend_layout = QHBoxLayout(legend_frame)
         legend_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        def create_symbol_label(symbol, color):
-            style = f"""QLabel {{ color: {color}; font-size: 14pt; font-weight: bold; padding-right: 5px; }}"""
-            if symbol == 's': symbol_text = '■'
-            elif symbol == 'D': symbol_text = '◆'
-            elif symbol == 'o': symbol_text = '●'
-            else: symbol_text = symbol
-            label = QLabel(symbol_text)
-            label.setStyleSheet(style)
-            return label
-
-        legend_layout.addWidget(QLabel("<b>Legend:</b>"))
-        legend_layout.addWidget(create_symbol_label('s', 'green'))
-        legend_layout.addWidget(QLabel("Pin/Fixed"))
-        legend_layout.addWidget(create_symbol_label('D', 'darkgreen'))
-        legend_layout.addWidget(QLabel("Roller"))
-        legend_layout.addWidget(QLabel(" | <b>Member Forces:</b>"))
-        legend_layout.addWidget(QLabel("<span style='color:red;'>Tension</span>"))
-        legend_layout.addWidget(QLabel("| <span style='color:blue;'>Compression</span>"))
-        legend_layout.addWidget(QLabel("| <b>Loads:</b>"))
-        legend_layout.addWidget(QLabel("<span style='color:purple;'>Applied Load</span>"))
+        def symbol_html(symbol, color):
+            return f"<span style='color:{color}; font-size:14pt; font-weight:bold;'>{symbol}</span>&nbsp;"
+
+        # One rich-text label for the whole legend: a single widget and text layout, no per-item style sheets
+        legend_html = "&nbsp; ".join([
+            "<b>Legend:</b>",
+            symbol_html('■', 'green') + "Pin/Fixed",
+            symbol_html('◆', 'darkgreen') + "Roller",
+            "| <b>Member Forces:</b>",
+            "<span style='color:red;'>Tension</span>",
+            "| <span style='color:blue;'>Compression</span>",
+            "| <b>Loads:</b>",
+            "<span style='color:purple;'>Applied Load</span>",
+        ])
+        legend_layout.addWidget(QLabel(legend_html))
 
         viz_layout.addWidget(legend_frame)
         self.main_layout.addWidget(viz_panel)
 
     ## Data Handling Methods
 
+    def _cache_geometry(self, points_df):
+        """
+        Stores what show_truss needs from points_df that only changes with the design: the
+        coordinates, the node ID -> row map, the node label IDs and the larger auto-limit span.
+        Nodes are matched by the Node index or column, else by position.
+        """
+        is_node_indexed = points_df.index.name == 'Node'
+        if is_node_indexed:
+            node_ids = points_df.index.to_numpy()
+        elif 'Node' in points_df.columns:
+            node_ids = points_df['Node'].to_numpy()
+        else:
+            node_ids = np.arange(len(points_df))
+        idx_map = pd.Series(np.arange(len(node_ids)), index=node_ids)
+
+        self._geometry_points = points_df
+        # Row-major, so each node's (x, y) pair is contiguous for the per-member gathers
+        self._xy = np.ascontiguousarray(points_df[['x', 'y']].to_numpy(dtype=np.float64))
+        self._idx_map = idx_map[~idx_map.index.duplicated()]  # the first row wins for a repeated ID
+        self._label_ids = node_ids if is_node_indexed or 'Node' in points_df.columns else points_df.index.to_numpy()
+        self._max_span = max(self.auto_xlim[1] - self.auto_xlim[0], self.auto_ylim[1] - self.auto_ylim[0])
+
     def select_design_directory(self):
         """Opens a directory selector dialog and loads the selected data."""
         dialog = QFileDialog(self)
@@ -284,9 +403,13 @@ class TrussRenderer(QMainWindow):
 
             points_df = self.data['points']
             if not points_df.empty and 'x' in points_df.columns and 'y' in points_df.columns:
-                self.auto_xlim = (points_df['x'].min(), points_df['x'].max())
-                self.auto_ylim = (points_df['y'].min(), points_df['y'].max())
+                # Both axes' bounds from one reduction each over the (N, 2) array; nan-aware like Series.min/max
+                xy = points_df[['x', 'y']].to_numpy(dtype=np.float64)
+                lo, hi = np.nanmin(xy, axis=0), np.nanmax(xy, axis=0)
+                self.auto_xlim = (lo[0], hi[0])
+                self.auto_ylim = (lo[1], hi[1])
                 self.reset_axis_limits() # This also triggers a refresh_plot
+            self._cache_geometry(points_df)
             
             # UPDATE: Set the default title in the text field
             default_title = f"Truss Diagram: {os.path.basename(self.current_data_dir)}"
@@ -313,114 +436,126 @@ class TrussRenderer(QMainWindow):
         self.xmax_edit.setText("")
         self.ymin_edit.setText("")
         self.ymax_edit.setText("")
-        self.refresh_plot()
+        self._user_limits = (None,) * 4
+        self.refresh_plot({'limits'})
+
+    def _on_limits_edited(self):
+        """
+        Parses the axis limit fields once per edit, so redraws (e.g. while zooming) just read the
+        numbers. If a field isn't a number, the user is told once and the auto limits are used.
+        """
+        edits = (self.xmin_edit, self.xmax_edit, self.ymin_edit, self.ymax_edit)
+        try:
+            self._user_limits = tuple(float(edit.text()) if edit.text() else None for edit in edits)
+        except ValueError:
+            self._user_limits = (None,) * 4
+            QMessageBox.warning(self, "Input Error", "Please enter valid numbers for axis limits.")
+        self.refresh_plot({'limits'})
 
     ## Plotting and Export Methods
 
-    def refresh_plot(self):
-        """Clears the canvas and redraws the truss with current settings."""
+    def refresh_plot(self, parts=REFRESH_ALL):
+        """
+        Schedules a redraw of the given parts of the plot (see REFRESH_ALL) with the current
+        settings; the parts of repeated calls before it runs are merged.
+        """
+        self._pending_parts |= parts
+        self._refresh_timer.start()
+
+    def _do_refresh(self):
+        """Redraws the parts of the truss plot requested since the last redraw (all if none were)."""
+        self._refresh_timer.stop()
+        self._update_slider_labels()
+        parts, self._pending_parts = self._pending_parts or REFRESH_ALL, set()
         if self.data is not None:
-            self.show_truss(self.data)
+            self.show_truss(self.data, parts)
 
-    def get_user_limits(self):
-        """Reads user-defined limits, falling back to auto limits."""
-        min_x, max_x = self.auto_xlim
-        min_y, max_y = self.auto_ylim
-        try:
-            if self.xmin_edit.text(): min_x = float(self.xmin_edit.text())
-            if self.xmax_edit.text(): max_x = float(self.xmax_edit.text())
-            if self.ymin_edit.text(): min_y = float(self.ymin_edit.text())
-            if self.ymax_edit.text(): max_y = float(self.ymax_edit.text())
-            return (min_x, max_x), (min_y, max_y)
-        except ValueError:
-            QMessageBox.warning(self, "Input Error", "Please enter valid numbers for axis limits.")
-            return self.auto_xlim, self.auto_ylim
+    def _update_slider_labels(self):
+        """Shows the slider values next to the sliders; done per redraw rather than per slider tick."""
+        self.axis_text_size_label.setText(f"{self.axis_text_size_slider.value()} pts")
+        self.scale_label.setText(f"{self.scale_slider.value()/100:.2f}")
+        self.text_size_label.setText(f"{self.text_size_slider.value()} pts")
+        self.zoom_label.setText(f"{self.zoom_slider.value()}% pad")
 
-    def show_truss(self, data):
-        """Draws the truss diagram with all current display settings."""
+    def get_user_limits(self):
+        """Returns the user-defined limits, falling back to auto limits for blank fields."""
+        min_x, max_x, min_y, max_y = (auto if user is None else user for user, auto in
+                                      zip(self._user_limits, self.auto_xlim + self.auto_ylim))
+        return (min_x, max_x), (min_y, max_y)
+
+    def show_truss(self, data, parts=REFRESH_ALL):
+        """
+        Draws the truss diagram with all current display settings. Only the given parts
+        (see REFRESH_ALL) are brought up to date, unless data is new and the figure is rebuilt.
+        """
         if data is None or data['points'].empty:
             self.truss_canvas.fig.clf()
             self.axes = self.truss_canvas.fig.add_subplot(111)
             self.axes.set_title("No Data Loaded")
             self.axes.set_aspect('auto')
-            self.truss_canvas.draw()
+            self._artists = {}
+            self.truss_canvas.set_animated_artists([])
+            self.truss_canvas.draw_idle()
             return
 
-        self.truss_canvas.fig.clf()
-        self.axes = self.truss_canvas.fig.add_subplot(111)
-
-        points_df = data['points']
-        trusses_df = data['trusses']
-        supports_df = data['supports']
-        is_node_indexed = points_df.index.name == 'Node'
-
-        def get_node_coords(node_id):
-            try:
-                if is_node_indexed:
-                    coords = points_df.loc[node_id, ['x', 'y']].values
-                elif 'Node' in points_df.columns:
-                    coords = points_df[points_df['Node'] == node_id][['x', 'y']].values[0]
-                else:
-                    coords = points_df.iloc[node_id][['x', 'y']].values
-                return coords.flatten()
-            except (KeyError, IndexError):
-                return None
-
-        stresses_df, _ = run_truss_simulation(data)
-        text_size = self.text_size_slider.value()
-
-        # Plot members
-        for _, row in trusses_df.iterrows():
-            p1 = get_node_coords(row['start'])
-            p2 = get_node_coords(row['end'])
-            if p1 is None or p2 is None: continue
-            
-            force_row = stresses_df[stresses_df['element'] == row['element']]
-            force = force_row['axial_force'].iloc[0] if not force_row.empty else 0
-            color = 'blue' if force < 0 else 'red'
-            self.axes.plot([p1[0], p2[0]], [p1[1], p2[1]], color=color, linewidth=2)
-            
-            if self.show_trusses_cb.isChecked():
-                mid_x, mid_y = (p1[0] + p2[0]) / 2, (p1[1] + p2[1]) / 2
-                self.axes.text(mid_x, mid_y, str(int(row['element'])), ha='center', va='center', fontsize=text_size-2,
-                               bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', pad=1))
-
-        # Plot nodes
-        self.axes.plot(points_df['x'], points_df['y'], 'o', color='black', zorder=5, markersize=5)
-        if self.show_nodes_cb.isChecked():
-            span_x, span_y = self.auto_xlim[1] - self.auto_xlim[0], self.auto_ylim[1] - self.auto_ylim[0]
-            max_span = max(span_x, span_y)
-            offset = max_span * 0.015 if max_span > 0 else 0.05
-            for index, row in points_df.iterrows():
-                node_id = index if is_node_indexed else row.get('Node', index)
-                if pd.isna(row['x']) or pd.isna(row['y']): continue
-                self.axes.text(row['x'] + offset, row['y'] + offset, str(int(node_id)),
-                               ha='left', va='bottom', fontsize=text_size, fontweight='bold', zorder=8)
-
-        # Plot supports
-        for _, row in supports_df.iterrows():
-            node_pos = get_node_coords(row['Node'])
-            if node_pos is None: continue
-            self.axes.plot(node_pos[0], node_pos[1], 's', color='green', markersize=12, zorder=6)
-
-        # Plot loads
-        if data.get('loads') is not None and not data['loads'].empty:
-            max_span = max(self.auto_xlim[1] - self.auto_xlim[0], self.auto_ylim[1] - self.auto_ylim[0])
-            if max_span <= 0: max_span = 1.0
-            arrow_scale = max_span * (self.scale_slider.value() / 100.0)
-            for _, row in data['loads'].iterrows():
-                node_pos = get_node_coords(row['Node'])
-                if node_pos is None: continue
-                fx, fy = row.get('Fx', 0), row.get('Fy', 0)
-                force_mag = np.sqrt(fx**2 + fy**2)
-                if force_mag > 0:
-                    unit_fx, unit_fy = fx / force_mag, fy / force_mag
-                    dx, dy = unit_fx * arrow_scale, unit_fy * arrow_scale
-                    self.axes.arrow(node_pos[0], node_pos[1], dx, dy,
-                                    head_width=0.05 * arrow_scale, head_length=0.075 * arrow_scale,
-                                    fc='purple', ec='purple', linewidth=2, zorder=7)
-
-        # Apply Axis Limits, Zoom, and Aspect
+        # The figure is only rebuilt for new data; display settings update the existing artists
+        if self._artists.get('data') is not data:
+            self._build_truss_artists(data)
+            parts = REFRESH_ALL
+
+        # Load arrows and node labels are drawn on top of everything else, so they are kept out of
+        # the cached background; changes to only those are blitted instead of redrawing the figure
+        background_changed = bool(parts - {'arrows', 'labels'})
+        if 'arrows' in parts:
+            self._apply_arrow_scale()
+        if 'limits' in parts:
+            self._apply_limits()
+        if 'limits' in parts or 'labels' in parts:
+            # Label visibility depends on the limits
+            background_changed |= self._apply_labels()
+        if 'titles' in parts:
+            self._apply_titles()
+        animated = list(self._artists.get('node_labels', []))
+        if 'load_arrows' in self._artists:
+            animated.append(self._artists['load_arrows'])
+        self.truss_canvas.set_animated_artists(animated)
+
+        # tight_layout is only re-run when something that sets the margins has changed (new figure,
+        # figure size, aspect, title and axis labels); arrow scale, zoom and label toggles skip it
+        layout_key = (tuple(self.truss_canvas.fig.get_size_inches()), self.axes.get_aspect(),
+                      self.axes.get_title(), self.axes.get_xlabel(), self.axes.get_ylabel(),
+                      self.axes.title.get_fontsize())
+        if layout_key != self._layout_key:
+            self.truss_canvas.fig.tight_layout()
+            self._layout_key = layout_key
+        elif not background_changed and self.truss_canvas.can_blit:
+            self.truss_canvas.blit_animated()
+            return
+        self.truss_canvas.draw_idle()
+
+    def _apply_arrow_scale(self):
+        """Load arrows: one quiver, replaced when the scale slider has moved."""
+        artists = self._artists
+        max_span = self._max_span if self._max_span > 0 else 1.0
+        arrow_scale = max_span * (self.scale_slider.value() / 100.0)
+        # The quiver's shaft width is in data units, so it can't be rescaled in place
+        if len(artists['load_pos']) and artists.get('load_scale') != arrow_scale:
+            if artists.get('load_arrows') is not None:
+                artists['load_arrows'].remove()
+            # Unit direction scaled so the tip lands where a head_length-capped arrow used to end
+            length = arrow_scale * 1.075
+            load_pos, load_dir = artists['load_pos'], artists['load_dir']
+            # Shaft width in data units; head sizes are multiples of it (0.05 and 0.075 of arrow_scale)
+            artists['load_arrows'] = self.axes.quiver(
+                load_pos[:, 0], load_pos[:, 1], load_dir[:, 0] * length, load_dir[:, 1] * length,
+                angles='xy', scale_units='xy', scale=1, units='xy', width=0.01 * arrow_scale,
+                headwidth=5, headlength=7.5, headaxislength=7.5,
+                color='purple', edgecolor='purple', linewidth=2, zorder=7
+            )
+            artists['load_scale'] = arrow_scale
+
+    def _apply_limits(self):
+        """Applies the axis limits, zoom padding and aspect (resizing the figure for a square aspect)."""
         (min_x, max_x), (min_y, max_y) = self.get_user_limits()
         span_x, span_y = max_x - min_x, max_y - min_y
         padding = self.zoom_slider.value() / 100.0
@@ -436,18 +571,70 @@ class TrussRenderer(QMainWindow):
             if total_span_x > 0 and total_span_y > 0:
                 fig_width = self.truss_canvas.default_width
                 fig_height = fig_width * (total_span_y / total_span_x)
-                self.truss_canvas.fig.set_size_inches(fig_width, fig_height, forward=True)
-                # BUG FIX: Notify the layout that the widget's size has changed
-                self.truss_canvas.updateGeometry()
+                self._resize_figure(fig_width, fig_height)
         else:
             self.axes.set_aspect('auto')
-            self.truss_canvas.fig.set_size_inches(self.truss_canvas.default_width,
-                                                  self.truss_canvas.default_height,
-                                                  forward=True)
-            # BUG FIX: Notify the layout that the widget's size has changed
-            self.truss_canvas.updateGeometry()
+            self._resize_figure(self.truss_canvas.default_width, self.truss_canvas.default_height)
+
+    def _resize_figure(self, width, height):
+        """
+        Sets the figure size, unless it is the size last requested: resizing forces a Qt relayout and
+        a full redraw, and zoom padding or label changes keep the aspect (and so the size) unchanged.
+        """
+        if self._figure_size == (width, height):
+            return
+        self._figure_size = (width, height)
+        self.truss_canvas.fig.set_size_inches(width, height, forward=True)
+        # BUG FIX: Notify the layout that the widget's size has changed
+        self.truss_canvas.updateGeometry()
+
+    def _apply_labels(self):
+        """
+        Shows, hides and resizes the node and element labels. Labels are created the first time
+        they are shown; those whose anchor is outside the current limits are hidden too, so they
+        skip text layout. Returns True if any element label is or was shown, since those are part
+        of the cached background.
+        """
+        artists = self._artists
+        text_size = self.text_size_slider.value()
+        (x_lo, x_hi), (y_lo, y_hi) = self.axes.get_xlim(), self.axes.get_ylim()
+
+        def in_view(points):
+            return (points[:, 0] >= x_lo) & (points[:, 0] <= x_hi) & (points[:, 1] >= y_lo) & (points[:, 1] <= y_hi)
 
-        # UPDATE: Apply custom labels and font sizes
+        element_labels_changed = False
+        show_elements = self.show_trusses_cb.isChecked()
+        if show_elements and 'element_labels' not in artists:
+            artists['element_labels'] = [
+                self.axes.text(mid_x, mid_y, str(int(element)), ha='center', va='center',
+                               bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', pad=1))
+                for element, (mid_x, mid_y) in zip(artists['elements'], artists['element_mids'])]
+        if 'element_labels' in artists:
+            visible = in_view(artists['element_mids']) & show_elements
+            element_labels_changed = artists.get('element_labels_shown', False) or bool(visible.any())
+            artists['element_labels_shown'] = bool(visible.any())
+            for label, label_visible in zip(artists['element_labels'], visible):
+                label.set_visible(label_visible)
+                label.set_fontsize(text_size - 2)
+
+        show_nodes = self.show_nodes_cb.isChecked()
+        if show_nodes and 'node_labels' not in artists:
+            offset = self._max_span * 0.015 if self._max_span > 0 else 0.05
+            labeled = ~np.isnan(self._xy).any(axis=1)
+            artists['node_xy'] = self._xy[labeled]
+            artists['node_labels'] = [
+                self.axes.text(x + offset, y + offset, str(int(node_id)),
+                               ha='left', va='bottom', fontweight='bold', zorder=8)
+                for node_id, (x, y) in zip(self._label_ids[labeled], artists['node_xy'])]
+        if 'node_labels' in artists:
+            visible = in_view(artists['node_xy']) & show_nodes
+            for label, label_visible in zip(artists['node_labels'], visible):
+                label.set_visible(label_visible)
+                label.set_fontsize(text_size)
+        return element_labels_changed
+
+    def _apply_titles(self):
+        """Applies the custom title and axis labels and their font size."""
         axis_fontsize = self.axis_text_size_slider.value()
         title_text = self.title_edit.text()
         if not title_text: # Provide a default if empty
@@ -456,9 +643,87 @@ class TrussRenderer(QMainWindow):
         self.axes.set_title(title_text, fontsize=axis_fontsize)
         self.axes.set_xlabel(self.xlabel_edit.text(), fontsize=axis_fontsize)
         self.axes.set_ylabel(self.ylabel_edit.text(), fontsize=axis_fontsize)
+
+    def _build_truss_artists(self, data):
+        """
+        Clears the figure and adds the members, nodes, supports and load arrows of data, keeping
+        them (and what the labels and arrows need later) in self._artists for show_truss to update.
+        """
+        self.truss_canvas.fig.clf()
+        self.axes = self.truss_canvas.fig.add_subplot(111)
         self.axes.grid(True)
-        self.truss_canvas.fig.tight_layout()
-        self.truss_canvas.draw()
+        self._layout_key = None
+        self.truss_canvas.set_animated_artists([])
+
+        points_df = data['points']
+        trusses_df = data['trusses']
+        supports_df = data['supports']
+        if points_df is not self._geometry_points:
+            self._cache_geometry(points_df)
+        xy, idx_map = self._xy, self._idx_map
+
+        def node_rows(node_column):
+            """Rows of points_df for a column of node IDs (NaN where the node is unknown)."""
+            return idx_map.reindex(node_column.to_numpy()).to_numpy(dtype=float)
+
+        stresses_df, _ = run_truss_simulation(data)
+
+        # Member endpoints and forces for all members at once; members with an unknown node are skipped
+        s_idx, e_idx = node_rows(trusses_df['start']), node_rows(trusses_df['end'])
+        drawn = ~np.isnan(s_idx) & ~np.isnan(e_idx)
+        P1, P2 = xy[s_idx[drawn].astype(int)], xy[e_idx[drawn].astype(int)]
+        elements = trusses_df['element'].to_numpy()[drawn]
+        # First result row per element; members without a result count as zero force
+        force_by_element = stresses_df.drop_duplicates('element').set_index('element')['axial_force']
+        forces = force_by_element.reindex(elements).fillna(0).to_numpy(dtype=float)
+
+        # Plot members as a single collection: compression blue, tension red
+        segments = np.stack([P1, P2], axis=1)
+        colors = np.where(forces < 0, 'blue', 'red')
+        members = LineCollection(segments, colors=colors, linewidths=2, zorder=2)
+        large_truss = len(segments) > LARGE_TRUSS_MEMBERS
+        if large_truss:
+            members.set_antialiased(False)
+            members.set_rasterized(True)
+        self.axes.add_collection(members)
+
+        # Plot nodes
+        self.axes.plot(points_df['x'], points_df['y'], 'o', color='black', zorder=5, markersize=5,
+                       rasterized=large_truss)
+
+        # Plot supports: one marker line per support type, as in the legend. Rollers are restrained
+        # in exactly one direction (X or Y); every other row of supports.csv, including one without
+        # Rx/Ry columns or with neither direction restrained, is drawn as fixed so no support is lost
+        support_rows = node_rows(supports_df['Node'])
+        known = ~np.isnan(support_rows)
+        roller = np.zeros_like(known)
+        if {'Rx', 'Ry'} <= set(supports_df.columns):
+            Rx, Ry = supports_df['Rx'].to_numpy(), supports_df['Ry'].to_numpy()
+            roller = known & (((Rx == 0) & (Ry == 1)) | ((Rx == 1) & (Ry == 0)))
+        fixed = known & ~roller
+        for shown, marker, color in ((fixed, 's', 'green'), (roller, 'D', 'darkgreen')):
+            if shown.any():
+                support_pos = xy[support_rows[shown].astype(int)]
+                self.axes.plot(support_pos[:, 0], support_pos[:, 1], marker, color=color, markersize=12,
+                               zorder=6, linestyle='none')
+
+        # Plot loads: positions and unit directions, drawn by show_truss at the current arrow scale
+        load_pos, load_dir = np.empty((0, 2)), np.empty((0, 2))
+        loads_df = data.get('loads')
+        if loads_df is not None and not loads_df.empty:
+            load_rows = node_rows(loads_df['Node'])
+            fx = loads_df['Fx'].to_numpy(dtype=float) if 'Fx' in loads_df.columns else np.zeros(len(loads_df))
+            fy = loads_df['Fy'].to_numpy(dtype=float) if 'Fy' in loads_df.columns else np.zeros(len(loads_df))
+            force_mag = np.sqrt(fx**2 + fy**2)
+            # Loads on unknown nodes and zero (or NaN) loads are not drawn
+            shown = ~np.isnan(load_rows) & (force_mag > 0)
+            load_pos = xy[load_rows[shown].astype(int)]
+            load_dir = np.column_stack([fx[shown] / force_mag[shown], fy[shown] / force_mag[shown]])
+
+        self._artists = {
+            'data': data, 'elements': elements, 'element_mids': 0.5 * (P1 + P2),
+            'load_pos': load_pos, 'load_dir': load_dir,
+        }
 
     def export_plot(self):
         """Saves the current Matplotlib plot to a PNG file."""
@@ -472,8 +737,20 @@ class TrussRenderer(QMainWindow):
                                                      "PNG Files (*.png);;All Files (*)")
         if file_path:
             try:
-                self.refresh_plot()
-                self.truss_canvas.fig.savefig(file_path, dpi=300, bbox_inches='tight')
+                # The figure already shows the current settings unless a coalesced redraw is still pending
+                if self._refresh_timer.isActive():
+                    self._do_refresh()
+                # Animated artists (the load arrows) are skipped by savefig, so they are made
+                # ordinary artists for the export and animated again afterwards
+                animated = self.truss_canvas.animated_artists
+                self.truss_canvas.set_animated_artists([])
+                for artist in animated:
+                    artist.set_animated(False)
+                try:
+                    self.truss_canvas.fig.savefig(file_path, dpi=300, bbox_inches='tight')
+                finally:
+                    self.truss_canvas.set_animated_artists(animated)
+                    self.truss_canvas.draw_idle()
                 self.status_label.setText(f"Successfully exported plot to: {file_path}")
             except Exception as e:
                 self.status_label.setText(f"Error during export: {str(e)}")
@@ -0,0 +1,54 @@
+# test_fem_solver_2d.py
+# Run from the repository root with: python -m unittest discover tests
+
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from optimizer import fem_solver
+
+
+def grid_truss(nx, ny):
+    """A cross-braced nx-by-ny grid cantilever: the first column of nodes is pinned, the last one loaded."""
+    node_ids = np.arange(nx * ny).reshape(nx, ny) + 1
+    x, y = np.meshgrid(np.arange(nx, dtype=float), np.arange(ny, dtype=float), indexing='ij')
+    points = pd.DataFrame({'Node': node_ids.ravel(), 'x': x.ravel(), 'y': y.ravel()})
+
+    member_pairs = [(node_ids[:-1, :], node_ids[1:, :]), (node_ids[:, :-1], node_ids[:, 1:]),
+                    (node_ids[:-1, :-1], node_ids[1:, 1:]), (node_ids[1:, :-1], node_ids[:-1, 1:])]
+    start = np.concatenate([a.ravel() for a, _ in member_pairs])
+    end = np.concatenate([b.ravel() for _, b in member_pairs])
+    trusses = pd.DataFrame({'element': np.arange(len(start)) + 1, 'start': start, 'end': end})
+
+    supports = pd.DataFrame({'Node': node_ids[0, :], 'Rx': 1, 'Ry': 1})
+    materials = pd.DataFrame({'E': [210e9], 'A': [0.00015]})
+    loads = pd.DataFrame({'Node': node_ids[-1, :], 'Fx': 0.0, 'Fy': -3000.0})
+    return points, trusses, supports, materials, loads
+
+
+class MixedPrecisionSolveTest(unittest.TestCase):
+
+    def setUp(self):
+        self._dtype = fem_solver.STIFFNESS_DTYPE
+
+    def tearDown(self):
+        fem_solver.STIFFNESS_DTYPE = self._dtype
+
+    def test_refinement_recovers_float64_forces(self):
+        truss = grid_truss(30, 12)
+        fem_solver.STIFFNESS_DTYPE = np.float64
+        reference = fem_solver.truss_analyze_arrays(*truss)[0]['axial_force']
+
+        fem_solver.STIFFNESS_DTYPE = np.float32
+        forces = fem_solver.truss_analyze_arrays(*truss)[0]['axial_force']
+
+        self.assertLess(np.abs(forces - reference).max() / np.abs(reference).max(), 1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+# test_fem_solver_3d.py
+# Run from the repository root with: python -m unittest discover tests
+
+import os
+import sys
+import contextlib
+import io
+import unittest
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from optimizer_3d import fem_solver
+
+
+def tetrahedron(apex_z):
+    """A tetrahedron with a fixed base triangle and a loaded apex at height apex_z (flat for apex_z -> 0)."""
+    points = pd.DataFrame({'Node': [1, 2, 3, 4], 'x': [0.0, 1.0, 0.0, 0.3],
+                           'y': [0.0, 0.0, 1.0, 0.3], 'z': [0.0, 0.0, 0.0, apex_z]})
+    trusses = pd.DataFrame({'element': [1, 2, 3], 'start': [1, 2, 3], 'end': [4, 4, 4], 'material_id': [1, 1, 1]})
+    supports = pd.DataFrame({'Node': [1, 2, 3], 'Rx': [1, 1, 1], 'Ry': [1, 1, 1], 'Rz': [1, 1, 1]})
+    materials = pd.DataFrame({'E': [2e11], 'A': [1e-4], 'I': [1e-8]}, index=pd.Index([1], name='material_id'))
+    loads = pd.DataFrame({'Node': [4], 'Fx': [0.0], 'Fy': [0.0], 'Fz': [-1000.0]})
+    return points, trusses, supports, materials, loads
+
+
+def analyze(*args):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fem_solver.truss_analyze(*args)
+
+
+class NearMechanismTest(unittest.TestCase):
+
+    def test_regular_tetrahedron_is_solved(self):
+        results, _ = analyze(*tetrahedron(1.0))
+        self.assertFalse(results.empty)
+        # Largest member force of the reference (dense cond) solver
+        self.assertAlmostEqual(np.abs(results.axial_force).max(), 434.5112196, places=4)
+
+    def test_near_flat_tetrahedron_is_rejected(self):
+        # cond(K_red) grows like 1/z^2 (about 2.5e13 at z = 1e-7), past MAX_COND
+        results, displacements = analyze(*tetrahedron(1e-7))
+        self.assertTrue(results.empty)
+        self.assertEqual(displacements.size, 0)
+
+    def test_condition_estimate_tracks_dense_cond(self):
+        points, trusses, supports, materials, loads = tetrahedron(1e-5)
+        topology = fem_solver.build_topology(points, trusses, supports, materials, loads)
+        K = fem_solver.assemble_truss_stiffness(points[['x', 'y', 'z']].to_numpy(dtype=float), topology)[0]
+        free_dof = topology['free_dof']
+        K_red = K.tocsc()[free_dof, :][:, free_dof]
+        estimate = fem_solver._condition_estimate(K_red, fem_solver._factorize(K_red))
+        exact = np.linalg.cond(K_red.toarray(), 1)
+        self.assertLess(abs(estimate / exact - 1), 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()